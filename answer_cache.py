@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+import fcntl
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from .sources import read_bytes
+
+ANSWER_CACHE_DIR_VARIABLE = "AOC_ANSWER_CACHE_DIR"
+
+# A relative import, e.g. `from ..sources import read_bytes`
+RELATIVE_IMPORT = re.compile(r"^[ \t]*from (\.+)([\w.]*) import \(?([\w, ]*)", re.M)
+
+
+def answer_cache_dir() -> Path:
+    """Return the directory answers are cached in.
+
+    Returns
+    -------
+    Path
+        The directory named by the `AOC_ANSWER_CACHE_DIR` environment variable, by
+        default `~/.cache/aoc2024/answers`.
+
+    """
+    directory = os.environ.get(ANSWER_CACHE_DIR_VARIABLE)
+    if directory:
+        return Path(directory)
+    return Path.home() / ".cache" / "aoc2024" / "answers"
+
+
+def _relative_imports(path: Path) -> set[Path]:
+    """Return the files of the package modules a module imports relatively."""
+    imported = set()
+    for dots, name, names in RELATIVE_IMPORT.findall(path.read_text()):
+        base = path.parents[len(dots) - 1]
+        if name:
+            modules = [base.joinpath(*name.split("."))]
+        else:
+            # `from .. import name` may import modules rather than names.
+            modules = [base / item.strip() for item in names.split(",") if item.strip()]
+        for module in modules:
+            for candidate in (module.with_suffix(".py"), module / "__init__.py"):
+                if candidate.is_file():
+                    imported.add(candidate)
+                    break
+    return imported
+
+
+def module_files(module: ModuleType) -> list[Path]:
+    """Return the source files a module of this package depends on.
+
+    Parameters
+    ----------
+    module : ModuleType
+        A module of this package, e.g. a `dayNN.sol` module.
+
+    Returns
+    -------
+    list[Path]
+        The module's own file and those of the package modules it imports
+        relatively, directly or not, sorted.
+
+    """
+    start = Path(module.__file__).resolve()
+    seen = {start}
+    pending = [start]
+    while pending:
+        for path in _relative_imports(pending.pop()):
+            if path not in seen:
+                seen.add(path)
+                pending.append(path)
+    return sorted(seen)
+
+
+def source_digest(module: ModuleType) -> bytes:
+    """Hash the source of a module and of every package module it depends on.
+
+    Parameters
+    ----------
+    module : ModuleType
+        A module of this package, e.g. a `dayNN.sol` module.
+
+    Returns
+    -------
+    bytes
+        A SHA-256 digest that changes whenever one of the `module_files` changes.
+
+    """
+    root = Path(module.__file__).resolve().parents[1]
+    digest = hashlib.sha256()
+    for path in module_files(module):
+        digest.update(str(path.relative_to(root)).encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.digest()
+
+
+def answer_key(module: ModuleType, function_name: str, filename: str | bytes) -> str:
+    """Return the cache key of a solve function run on an input.
+
+    Parameters
+    ----------
+    module : ModuleType
+        The `dayNN.sol` module holding the solve function.
+    function_name : str
+        The name of the solve function.
+    filename : str | bytes
+        The path of the input file, or its content.
+
+    Returns
+    -------
+    str
+        A key that changes whenever the input, the module's source or the source of
+        a package module it depends on changes.
+
+    """
+    digest = hashlib.sha256()
+    digest.update(module.__name__.encode())
+    digest.update(function_name.encode())
+    digest.update(source_digest(module))
+    digest.update(hashlib.sha256(read_bytes(filename)).digest())
+    return digest.hexdigest()
+
+
+def lookup(key: str, directory: Path | None = None) -> tuple[bool, Any]:
+    """Look an answer up in the cache.
+
+    Parameters
+    ----------
+    key : str
+        The key returned by `answer_key`.
+    directory : Path, optional
+        The cache directory, by default `answer_cache_dir()`.
+
+    Returns
+    -------
+    tuple[bool, Any]
+        Whether the answer was found, and the answer.
+
+    """
+    directory = directory or answer_cache_dir()
+    try:
+        with (directory / f"{key}.json").open() as file:
+            entry = json.load(file)
+    except FileNotFoundError:
+        return False, None
+    # JSON has no tuples, so answers returned as tuples are tagged.
+    if entry.get("tuple"):
+        return True, tuple(entry["answer"])
+    return True, entry["answer"]
+
+
+def store(key: str, answer: Any, directory: Path | None = None) -> None:
+    """Store an answer in the cache.
+
+    The entry is written to a temporary file and renamed into place, so concurrent
+    readers never see a partial entry.
+
+    Parameters
+    ----------
+    key : str
+        The key returned by `answer_key`.
+    answer : Any
+        The answer, which must be JSON serializable. Tuples are returned as tuples
+        by `lookup`.
+    directory : Path, optional
+        The cache directory, by default `answer_cache_dir()`.
+
+    """
+    directory = directory or answer_cache_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    descriptor, staging = tempfile.mkstemp(dir=directory, prefix=".staging-")
+    with os.fdopen(descriptor, "w") as file:
+        json.dump({"answer": answer, "tuple": isinstance(answer, tuple)}, file)
+    os.replace(staging, directory / f"{key}.json")
+
+
+def cached_solve(
+    module: ModuleType,
+    function_name: str,
+    filename: str | bytes,
+    directory: Path | None = None,
+) -> tuple[Any, bool]:
+    """Run a solve function, or return its cached answer for an unchanged input and
+    unchanged code.
+
+    Processes solving the same key at the same time wait for the first one and then
+    read its answer, instead of all running the solver.
+
+    Parameters
+    ----------
+    module : ModuleType
+        The `dayNN.sol` module holding the solve function.
+    function_name : str
+        The name of the solve function, e.g. "solve_part_a".
+    filename : str | bytes
+        The path of the input file, or its content.
+    directory : Path, optional
+        The cache directory, by default `answer_cache_dir()`.
+
+    Returns
+    -------
+    tuple[Any, bool]
+        The answer, and whether it came from the cache.
+
+    """
+    directory = directory or answer_cache_dir()
+    key = answer_key(module, function_name, filename)
+    found, answer = lookup(key, directory)
+    if found:
+        return answer, True
+
+    solve: Callable[[str], Any] = getattr(module, function_name)
+    directory.mkdir(parents=True, exist_ok=True)
+    with (directory / f".{key}.lock").open("w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            found, answer = lookup(key, directory)
+            if found:
+                return answer, True
+            answer = solve(filename)
+            store(key, answer, directory)
+            return answer, False
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
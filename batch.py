@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .runner import load_day
+
+# The solve function of the worker process, set once by `_init_worker`
+_solve: Callable[[str], Any] | None = None
+
+
+def input_files(
+    manifest: str | None = None, directory: str | None = None, pattern: str = "*.txt"
+) -> list[str]:
+    """List the input files of a batch.
+
+    Parameters
+    ----------
+    manifest : str, optional
+        A file listing one input per line. Relative paths are relative to the
+        manifest, and blank lines and lines starting with "#" are skipped.
+    directory : str, optional
+        A directory whose files matching `pattern` are the inputs.
+    pattern : str, optional
+        The glob pattern of the inputs in `directory`, by default "*.txt".
+
+    Returns
+    -------
+    list[str]
+        The paths of the inputs, from the manifest followed by the directory.
+
+    """
+    filenames = []
+    if manifest is not None:
+        base = Path(manifest).parent
+        with Path(manifest).open() as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    filenames.append(str(base / line))
+    if directory is not None:
+        filenames.extend(str(path) for path in sorted(Path(directory).glob(pattern)))
+    return filenames
+
+
+def _init_worker(day: int, function: str) -> None:
+    """Import the solution once per worker process."""
+    global _solve
+    # Progress output of the solvers must not mix with the results on stdout.
+    sys.stdout = sys.stderr
+    _solve = getattr(load_day(day), function)
+
+
+def _solve_file(filename: str) -> dict:
+    """Solve one input in a worker, reporting a failure instead of raising it."""
+    start = time.perf_counter()
+    try:
+        answer = _solve(filename)
+    except Exception as error:
+        return {"input": filename, "error": f"{type(error).__name__}: {error}"}
+    return {
+        "input": filename,
+        "answer": answer,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def solve_batch(
+    day: int,
+    part: str,
+    filenames: list[str],
+    function: str | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 16,
+) -> Iterator[dict]:
+    """Solve one part of a day on many inputs with a pool of warm workers.
+
+    Each worker imports the solution once and then solves a chunk of inputs at a
+    time, so interpreter start-up and imports are paid once per worker instead of
+    once per input.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+    part : str
+        Either "a" or "b".
+    filenames : list[str]
+        The paths of the inputs.
+    function : str, optional
+        The name of the solve function to run instead of `solve_part_<part>`, by
+        default None.
+    max_workers : int, optional
+        The number of processes, by default the number of CPUs.
+    chunksize : int, optional
+        The number of inputs sent to a worker at once, by default 16.
+
+    Yields
+    ------
+    dict
+        The input, and its answer and solve time in seconds or the error it raised,
+        in the order of `filenames`.
+
+    """
+    if part not in ("a", "b"):
+        raise ValueError(f"Invalid part: {part}")
+    function = function or f"solve_part_{part}"
+    # Fail early on an unknown day or function, rather than in every worker.
+    getattr(load_day(day), function)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(day, function),
+    ) as executor:
+        yield from executor.map(_solve_file, filenames, chunksize=chunksize)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Solve many inputs from the command line, printing one JSON line per input.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {__package__}.batch")
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", choices=("a", "b"))
+    parser.add_argument("--manifest", help="file listing one input per line")
+    parser.add_argument("--directory", help="directory holding the inputs")
+    parser.add_argument("--pattern", default="*.txt")
+    parser.add_argument("--function", help="solve function to run instead")
+    parser.add_argument("--workers", type=int, help="defaults to the number of CPUs")
+    parser.add_argument("--chunksize", type=int, default=16)
+    args = parser.parse_args(argv)
+    if args.manifest is None and args.directory is None:
+        parser.error("either --manifest or --directory is required")
+
+    filenames = input_files(args.manifest, args.directory, args.pattern)
+    failed = False
+    for result in solve_batch(
+        args.day, args.part, filenames, args.function, args.workers, args.chunksize
+    ):
+        failed = failed or "error" in result
+        print(json.dumps({"day": args.day, "part": args.part, **result}), flush=True)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import math
+import multiprocessing
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from .generators import PUZZLE_SIZES, generate
+from .runner import (
+    PACKAGE_DIR,
+    default_input,
+    discover_days,
+    load_day,
+    peak_rss_bytes,
+)
+
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+# Seconds a case may run before it is stopped and recorded as skipped, as the
+# slowest solvers take hours at the largest default scale
+DEFAULT_TIMEOUT = 60.0
+
+# Days whose input is a grid, scaled by tiling instead of repeating lines
+GRID_DAYS = (4, 6)
+
+
+def base_input(day: int) -> Path:
+    """Return the input a day's benchmarks are scaled from.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+
+    Returns
+    -------
+    Path
+        The day's `input.txt`, or its `test_input.txt` if there is no puzzle input.
+
+    """
+    filename = default_input(day)
+    if filename.exists():
+        return filename
+    return PACKAGE_DIR / f"day{day:02d}" / "test_input.txt"
+
+
+def scale_input(day: int, content: str, factor: int) -> str:
+    """Make an input roughly `factor` times larger than the given one.
+
+    Line-based inputs repeat their records, day05 repeats its updates under the same
+    rules, and grids are tiled with only the first guard kept.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+    content : str
+        The input to scale.
+    factor : int
+        The scale factor.
+
+    Returns
+    -------
+    str
+        The scaled input.
+
+    """
+    if factor == 1:
+        return content
+    if day == 3:
+        return content * factor
+    if day == 5:
+        rules, updates = content.strip().split("\n\n")
+        return rules + "\n\n" + "\n".join([updates.strip()] * factor) + "\n"
+    if day in GRID_DAYS:
+        rows = content.strip().split("\n")
+        down = math.isqrt(factor)
+        across = factor // down
+        tiled = [row * across for row in rows] * down
+        text = "\n".join(tiled) + "\n"
+        first_guard = text.find("^") + 1
+        return text[:first_guard] + text[first_guard:].replace("^", ".")
+    return "\n".join([content.strip()] * factor) + "\n"
+
+
+def _measure(connection, day: int, part: str, filename: str, function: str | None):
+    """Run one benchmark case in a fresh process and send back its measurements."""
+    try:
+        solve = getattr(load_day(day), function or f"solve_part_{part}")
+        start = time.perf_counter()
+        answer = solve(filename)
+        wall_seconds = time.perf_counter() - start
+    except Exception as error:
+        connection.send({"error": f"{type(error).__name__}: {error}"})
+        connection.close()
+        return
+
+    peak_rss = peak_rss_bytes()
+
+    # Allocations are traced in a second run so that they don't slow the timed one.
+    tracemalloc.start()
+    solve(filename)
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    connection.send(
+        {
+            "answer": answer,
+            "wall_seconds": wall_seconds,
+            "peak_rss_bytes": peak_rss,
+            "peak_traced_bytes": peak_traced,
+        }
+    )
+    connection.close()
+
+
+def run_case(
+    day: int,
+    part: str,
+    filename: str,
+    function: str | None = None,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> dict:
+    """Benchmark one part of a day on one input, in a fresh process.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+    part : str
+        Either "a" or "b".
+    filename : str
+        The path of the input file.
+    function : str, optional
+        The solve function to run instead of `solve_part_<part>`, by default None.
+    timeout : float, optional
+        Seconds after which the case is stopped, by default 60. None for no limit.
+
+    Returns
+    -------
+    dict
+        The answer, wall time, peak RSS and peak traced allocations of the case,
+        `{"skipped": ...}` with the reason if it did not finish in time, or
+        `{"error": ...}` if the solver raised or its process died.
+
+    """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_measure, args=(sender, day, part, filename, function)
+    )
+    process.start()
+    sender.close()
+    if not receiver.poll(timeout):
+        process.terminate()
+        process.join()
+        return {"skipped": f"timed out after {timeout:g} s"}
+    try:
+        measurements = receiver.recv()
+    except EOFError:
+        # The process died without sending anything, e.g. when killed.
+        measurements = {"error": "The benchmark process exited without a result"}
+    process.join()
+    return measurements
+
+
+def run_benchmarks(
+    days: list[int],
+    parts: list[str],
+    scales: list[int],
+    function: str | None = None,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    synthetic: bool = False,
+    seed: int = 0,
+) -> list[dict]:
+    """Benchmark every combination of day, part and scale.
+
+    Parameters
+    ----------
+    days : list[int]
+        The day numbers.
+    parts : list[str]
+        The parts, each either "a" or "b".
+    scales : list[int]
+        The factors to scale each day's input by.
+    function : str, optional
+        The solve function to run instead of `solve_part_<part>`, by default None.
+    timeout : float, optional
+        Seconds after which a case is stopped, by default 60. None for no limit.
+        Once a case is stopped, the same day and part are skipped at larger scales.
+    synthetic : bool, optional
+        Whether to generate inputs of `scale` times the puzzle size instead of
+        scaling the day's input, and check the answers against the generated ones,
+        by default False.
+    seed : int, optional
+        The seed of the generated inputs, by default 0.
+
+    Returns
+    -------
+    list[dict]
+        One result per case.
+
+    """
+    results = []
+    # The smallest scale each day and part timed out at
+    timed_out: dict[tuple[int, str], int] = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for day in days:
+            if not synthetic:
+                source = base_input(day)
+                content = source.read_text()
+            for scale in scales:
+                answers = None
+                if synthetic:
+                    source_name = f"generated:{seed}"
+                    scaled, answers = generate(day, PUZZLE_SIZES[day] * scale, seed)
+                else:
+                    source_name = source.name
+                    scaled = scale_input(day, content, scale)
+                filename = Path(scratch) / f"day{day:02d}_x{scale}.txt"
+                filename.write_text(scaled)
+                for part in parts:
+                    result = {
+                        "day": day,
+                        "part": part,
+                        "scale": scale,
+                        "source": source_name,
+                        "input_bytes": filename.stat().st_size,
+                    }
+                    if timed_out.get((day, part), scale + 1) < scale:
+                        result["skipped"] = (
+                            f"timed out at x{timed_out[day, part]} already"
+                        )
+                        results.append(result)
+                        continue
+                    result.update(run_case(day, part, str(filename), function, timeout))
+                    if "skipped" in result:
+                        timed_out[day, part] = min(
+                            scale, timed_out.get((day, part), scale)
+                        )
+                    if answers is not None and "answer" in result:
+                        result["expected"] = answers[part]
+                    results.append(result)
+    return results
+
+
+def find_regressions(
+    results: list[dict], baseline: list[dict], tolerance: float = 0.25
+) -> list[str]:
+    """Compare benchmark results with a baseline and with their expected answers.
+
+    Cases whose solver raised are always reported, and skipped cases only if they
+    finished in the baseline.
+
+    Parameters
+    ----------
+    results : list[dict]
+        The results returned by `run_benchmarks`.
+    baseline : list[dict]
+        Earlier results to compare with.
+    tolerance : float, optional
+        The relative increase allowed before a measurement counts as a regression,
+        by default 0.25.
+
+    Returns
+    -------
+    list[str]
+        A description of each regression found.
+
+    """
+    previous = {(r["day"], r["part"], r["scale"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        key = (result["day"], result["part"], result["scale"])
+        label = "day {} part {} x{}".format(*key)
+        if "error" in result:
+            regressions.append(f"{label}: {result['error']}")
+            continue
+        if "expected" in result and result["answer"] != result["expected"]:
+            regressions.append(
+                f"{label}: answer {result['answer']} != expected {result['expected']}"
+            )
+        if key not in previous:
+            continue
+        if "skipped" in result:
+            if "skipped" not in previous[key]:
+                regressions.append(f"{label}: {result['skipped']}")
+            continue
+        if "answer" in previous[key] and result["answer"] != previous[key]["answer"]:
+            regressions.append(
+                f"{label}: answer {result['answer']} != {previous[key]['answer']}"
+            )
+        for metric in ("wall_seconds", "peak_rss_bytes", "peak_traced_bytes"):
+            if metric in previous[key] and result[metric] > previous[key][metric] * (
+                1 + tolerance
+            ):
+                regressions.append(
+                    f"{label}: {metric} {result[metric]:.6g} > "
+                    f"{previous[key][metric]:.6g}"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmarks from the command line.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {__package__}.benchmark")
+    parser.add_argument("--days", type=int, nargs="+", default=list(discover_days()))
+    parser.add_argument("--parts", nargs="+", choices=("a", "b"), default=["a", "b"])
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    parser.add_argument("--function", help="solve function to run instead")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="seconds allowed per case, 0 for no limit",
+    )
+    parser.add_argument("--synthetic", action="store_true", help="use generated inputs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.days,
+        args.parts,
+        args.scales,
+        args.function,
+        args.timeout or None,
+        args.synthetic,
+        args.seed,
+    )
+    with Path(args.output).open("w") as file:
+        json.dump({"results": results}, file, indent=2)
+
+    for result in results:
+        if "skipped" in result:
+            timing = f"skipped ({result['skipped']})"
+        elif "error" in result:
+            timing = result["error"]
+        else:
+            timing = (
+                f"{result['wall_seconds']:.6f} s, "
+                f"{result['peak_rss_bytes'] / 2**20:.1f} MiB RSS, "
+                f"{result['peak_traced_bytes'] / 2**20:.1f} MiB traced"
+            )
+        print(f"day {result['day']} part {result['part']} x{result['scale']}: {timing}")
+
+    baseline = []
+    if args.baseline is not None:
+        with Path(args.baseline).open() as file:
+            baseline = json.load(file)["results"]
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
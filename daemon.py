@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+import argparse
+import collections
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .answer_cache import module_files, source_digest
+from .parse_cache import enable_memory_cache
+from .profiling import record_stages
+from .runner import discover_days, load_day, peak_rss_bytes
+
+SOCKET_VARIABLE = "AOC_DAEMON_SOCKET"
+
+DEFAULT_MAX_ANSWERS = 1024
+
+
+def daemon_socket() -> Path:
+    """Return the path of the daemon's Unix socket.
+
+    Returns
+    -------
+    Path
+        The path named by the `AOC_DAEMON_SOCKET` environment variable, by default
+        `~/.cache/aoc2024/daemon.sock`.
+
+    """
+    path = os.environ.get(SOCKET_VARIABLE)
+    if path:
+        return Path(path)
+    return Path.home() / ".cache" / "aoc2024" / "daemon.sock"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answer requests sent as JSON lines, one JSON line per request."""
+
+    server: "SolveServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.respond(json.loads(line))
+            except Exception as error:
+                response = {"error": f"{type(error).__name__}: {error}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if response.get("stopping"):
+                # Only once the response is sent, as the process exits on shutdown.
+                threading.Thread(target=self.server.shutdown).start()
+                break
+
+
+class SolveServer(socketserver.ThreadingUnixStreamServer):
+    """A server keeping every solution imported and its answers in memory.
+
+    Requests are JSON objects with an "op" of "solve" (the default), "stats" or
+    "shutdown". Solve requests carry a "day", a "part", the absolute path of an
+    "input" and optionally a "function", and are answered with the same fields as
+    `runner.run`, except that the peak resident set size is that of the daemon
+    since it started, in "daemon_peak_rss_bytes".
+
+    Answers are keyed by the content of the input and the source of the solution,
+    and the least recently used ones are dropped beyond `max_answers`. Before each
+    solve, the files the day's solution depends on are checked for changes, and
+    changed code is reloaded, so edits take effect without restarting the daemon.
+    Parsed inputs and the indexes built from them, such as day05's rule matrix and
+    predecessor bitsets and day06's obstacle jump tables, are kept in memory as
+    well, so that other parts and functions solving the same input skip building
+    them again.
+
+    Parameters
+    ----------
+    path : str
+        The path of the Unix socket to listen on.
+    max_answers : int, optional
+        The number of answers kept, by default 1024.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str, max_answers: int = DEFAULT_MAX_ANSWERS) -> None:
+        super().__init__(path, _Handler)
+        self.modules = {day: load_day(day) for day in discover_days()}
+        self.answers: collections.OrderedDict[tuple, Any] = collections.OrderedDict()
+        self.max_answers = max_answers
+        # The files each day depends on, their stat results and the digest of the
+        # code each day was loaded from
+        self.files: dict[int, list[Path]] = {}
+        self.stamps: dict[Path, tuple[int, int]] = {}
+        self.digests: dict[int, bytes] = {}
+        for day in self.modules:
+            self._record(day)
+        # Solvers share module state, so requests are solved one at a time.
+        self.solve_lock = threading.Lock()
+        self.requests = 0
+        enable_memory_cache()
+
+    def _record(self, day: int) -> None:
+        """Remember the code a day's solution was loaded from."""
+        self.files[day] = module_files(self.modules[day])
+        for path in self.files[day]:
+            self.stamps[path] = _stamp(path)
+        self.digests[day] = source_digest(self.modules[day])
+
+    def _reload_if_changed(self, day: int) -> None:
+        """Reload the code of a day's solution if its files changed since it was
+        loaded."""
+        changed = {
+            path for path in self.files[day] if self.stamps[path] != _stamp(path)
+        }
+        if not changed:
+            return
+        if changed == {Path(self.modules[day].__file__).resolve()}:
+            self.modules[day] = importlib.reload(self.modules[day])
+            self._record(day)
+            return
+
+        # A shared module changed. Every module holds the names it imported from
+        # the others, so all package modules the solutions use are reloaded,
+        # dependencies first, and then every solution.
+        solutions = {
+            Path(module.__file__).resolve() for module in self.modules.values()
+        }
+        shared = {
+            module
+            for module in list(sys.modules.values())
+            if getattr(module, "__file__", None)
+            and Path(module.__file__).resolve() in self.stamps.keys() - solutions
+        }
+        for module in sorted(shared, key=lambda module: len(module_files(module))):
+            importlib.reload(module)
+        for other in self.modules:
+            self.modules[other] = importlib.reload(self.modules[other])
+            self._record(other)
+        # Reloading the parse cache dropped its in-memory caches.
+        enable_memory_cache()
+
+    def respond(self, request: dict) -> dict:
+        """Answer one request.
+
+        Parameters
+        ----------
+        request : dict
+            The decoded request.
+
+        Returns
+        -------
+        dict
+            The response.
+
+        """
+        op = request.get("op", "solve")
+        if op == "shutdown":
+            return {"stopping": True}
+        if op == "stats":
+            return {
+                "days": sorted(self.modules),
+                "answers": len(self.answers),
+                "requests": self.requests,
+            }
+        if op != "solve":
+            raise ValueError(f"Unknown op: {op}")
+
+        day, part = request["day"], request["part"]
+        if part not in ("a", "b"):
+            raise ValueError(f"Invalid part: {part}")
+        if day not in self.modules:
+            raise ValueError(f"No solution found for day {day}")
+        function = request.get("function") or f"solve_part_{part}"
+
+        start = time.perf_counter()
+        with self.solve_lock:
+            self.requests += 1
+            self._reload_if_changed(day)
+            solve = getattr(self.modules[day], function)
+            key = (
+                day,
+                function,
+                self.digests[day],
+                hashlib.sha256(Path(request["input"]).read_bytes()).digest(),
+            )
+            cached = key in self.answers
+            stage_seconds = None
+            if cached:
+                self.answers.move_to_end(key)
+                answer = self.answers[key]
+            else:
+                with record_stages() as stage_seconds:
+                    answer = solve(request["input"])
+                self.answers[key] = answer
+                while len(self.answers) > self.max_answers:
+                    self.answers.popitem(last=False)
+        solve_seconds = time.perf_counter() - start
+        parse_seconds = None
+        if stage_seconds is not None and "parse" in stage_seconds:
+            parse_seconds = stage_seconds["parse"]
+            solve_seconds -= parse_seconds
+
+        return {
+            "day": day,
+            "part": part,
+            "function": function,
+            "answer": answer,
+            "cached": cached,
+            "parse_seconds": parse_seconds,
+            "solve_seconds": solve_seconds,
+            "stage_seconds": stage_seconds,
+            # Peaks of earlier requests would be reported as this one's.
+            "peak_rss_bytes": None,
+            "daemon_peak_rss_bytes": peak_rss_bytes(),
+        }
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    """Return the modification time and size of a file, to notice changes."""
+    status = path.stat()
+    return status.st_mtime_ns, status.st_size
+
+
+def request(message: dict, path: Path | None = None) -> dict:
+    """Send one request to a running daemon.
+
+    Parameters
+    ----------
+    message : dict
+        The request.
+    path : Path, optional
+        The path of the daemon's socket, by default `daemon_socket()`.
+
+    Returns
+    -------
+    dict
+        The response.
+
+    Raises
+    ------
+    OSError
+        If no daemon is listening on the socket.
+    RuntimeError
+        If the daemon could not answer the request.
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path or daemon_socket()))
+        client.sendall(json.dumps(message).encode() + b"\n")
+        with client.makefile("rb") as file:
+            line = file.readline()
+    if not line:
+        raise RuntimeError("The daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response
+
+
+def solve_remote(
+    day: int,
+    part: str,
+    filename: str,
+    function: str | None = None,
+    path: Path | None = None,
+) -> dict:
+    """Run one part of a day in a running daemon.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+    part : str
+        Either "a" or "b".
+    filename : str
+        The path of the input file.
+    function : str, optional
+        The name of the solve function to run instead of `solve_part_<part>`, by
+        default None.
+    path : Path, optional
+        The path of the daemon's socket, by default `daemon_socket()`.
+
+    Returns
+    -------
+    dict
+        The same fields as returned by `runner.run`, with the daemon's peak resident
+        set size in "daemon_peak_rss_bytes" instead of "peak_rss_bytes".
+
+    """
+    return request(
+        {
+            "day": day,
+            "part": part,
+            "input": os.path.abspath(filename),
+            "function": function,
+        },
+        path,
+    )
+
+
+def serve(path: Path | None = None) -> None:
+    """Run the daemon until it is sent a shutdown request or interrupted.
+
+    Parameters
+    ----------
+    path : Path, optional
+        The path of the socket to listen on, by default `daemon_socket()`.
+
+    """
+    path = path or daemon_socket()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        try:
+            request({"op": "stats"}, path)
+        except ConnectionRefusedError:
+            # Left behind by a daemon that did not exit cleanly
+            path.unlink()
+        else:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+
+    with SolveServer(str(path)) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run or stop the daemon from the command line.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {__package__}.daemon")
+    parser.add_argument("--socket", help=f"defaults to ${SOCKET_VARIABLE}")
+    parser.add_argument("--stop", action="store_true", help="stop a running daemon")
+    args = parser.parse_args(argv)
+
+    path = Path(args.socket) if args.socket else daemon_socket()
+    if args.stop:
+        request({"op": "shutdown"}, path)
+    else:
+        serve(path)
+
+
+if __name__ == "__main__":
+    main()
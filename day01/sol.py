@@ -1,26 +1,81 @@
 #!/usr/bin/env python3
-import numpy as np
+import sys
+from collections import Counter
+from pathlib import Path
 
+if not __package__:
+    # Run as a script, so make the package importable for the relative imports below.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    __package__ = ".".join(Path(__file__).resolve().parts[-3:-1])
 
-def load_and_split_data(filename: str):
-    data = np.loadtxt(filename)
+from ..intparse import SMALL_INPUT_BYTES, parse_int_rows, parse_ints
+from ..parse_cache import cached_loader
+from ..profiling import stage
+from ..sources import Source, read_bytes
+
+
+@cached_loader("arrays", version=2)
+def load_and_split_data(source: Source):
+    import numpy as np
+
+    values, offsets = parse_ints(read_bytes(source))
+    lengths = np.diff(offsets)
+    if not np.isin(lengths, (0, 2)).all():
+        raise ValueError("Every line must hold two numbers")
+    data = values.reshape(-1, 2)
     left_column = np.sort(data[:, 0])
     right_column = np.sort(data[:, 1])
     return left_column, right_column
 
 
-def solve_part_a(filename: str = "input.txt") -> int:
-    left_column, right_column = load_and_split_data(filename)
-    diff_column = np.abs(right_column - left_column)
-    return int(np.sum(diff_column))
+def load_small_input(source: Source) -> tuple[list[int], list[int]]:
+    pairs = [row for row in parse_int_rows(read_bytes(source)) if row]
+    left_column = sorted(left for left, _ in pairs)
+    right_column = sorted(right for _, right in pairs)
+    return left_column, right_column
+
+
+def solve_part_a(filename: Source = "input.txt") -> int:
+    with stage("parse"):
+        # Read once, as the input may be a stream.
+        data = read_bytes(filename)
+    if len(data) <= SMALL_INPUT_BYTES:
+        with stage("parse"):
+            left_column, right_column = load_small_input(data)
+        with stage("reduce"):
+            return sum(
+                abs(right - left) for left, right in zip(left_column, right_column)
+            )
+
+    import numpy as np
+
+    with stage("parse"):
+        left_column, right_column = load_and_split_data(data)
+    with stage("reduce"):
+        diff_column = np.abs(right_column - left_column)
+        return int(np.sum(diff_column))
+
+
+def solve_part_b(filename: Source = "input.txt") -> int:
+    with stage("parse"):
+        # Read once, as the input may be a stream.
+        data = read_bytes(filename)
+    if len(data) <= SMALL_INPUT_BYTES:
+        with stage("parse"):
+            left_column, right_column = load_small_input(data)
+        with stage("search"):
+            counts = Counter(right_column)
+            return sum(number * counts[number] for number in left_column)
 
+    import numpy as np
 
-def solve_part_b(filename: str = "input.txt") -> int:
-    left_column, right_column = load_and_split_data(filename)
+    with stage("parse"):
+        left_column, right_column = load_and_split_data(data)
     similarity_score = 0
-    for number in left_column:
-        count_in_right = np.count_nonzero(right_column == number)
-        similarity_score += number * count_in_right
+    with stage("search"):
+        for number in left_column:
+            count_in_right = np.count_nonzero(right_column == number)
+            similarity_score += number * count_in_right
     return int(similarity_score)
 
 
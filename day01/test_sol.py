@@ -1,3 +1,4 @@
+from . import sol
 from .sol import solve_part_a, solve_part_b
 
 
@@ -9,3 +10,9 @@ def test_solve_part_a():
 def test_solve_part_b():
     part_b_expected_output = 31
     assert solve_part_b("test_input.txt") == part_b_expected_output
+
+
+def test_large_input_engine(monkeypatch):
+    monkeypatch.setattr(sol, "SMALL_INPUT_BYTES", 0)
+    assert solve_part_a("test_input.txt") == 11
+    assert solve_part_b("test_input.txt") == 31
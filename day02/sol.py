@@ -1,13 +1,26 @@
 #!/usr/bin/env python3
+import sys
+from pathlib import Path
 
+if not __package__:
+    # Run as a script, so make the package importable for the relative imports below.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    __package__ = ".".join(Path(__file__).resolve().parts[-3:-1])
 
-def load_data(filename: str) -> list:
+from ..intparse import parse_int_rows
+from ..parse_cache import cached_loader
+from ..profiling import stage
+from ..sources import Source, read_bytes
+
+
+@cached_loader("ragged")
+def load_data(source: Source) -> list:
     """Load data from a file.
 
     Parameters
     ----------
-    filename : str
-        The name of the file to load data from.
+    source : Source
+        The file to load data from, or any input accepted by `sources.read_bytes`.
 
     Returns
     -------
@@ -16,8 +29,7 @@ def load_data(filename: str) -> list:
         file.
 
     """
-    with open(filename, "r") as file:
-        return [list(map(int, line.split())) for line in file]
+    return parse_int_rows(read_bytes(source))
 
 
 def is_monotonic(row: list) -> bool:
@@ -87,6 +99,111 @@ def is_safe(row: list, allow_dampened: bool = False) -> bool:
     return False
 
 
+def is_safe_with_removals(row: list, k: int) -> bool:
+    """Check if a row can be made safe by removing at most k levels.
+
+    For each direction, a dynamic program finds the fewest levels removed before a
+    safe chain ending at each level. Consecutive kept levels are at most k + 1 apart,
+    so each level looks back at k + 1 others, in O(n * k) time overall.
+
+    Parameters
+    ----------
+    row : list
+        The input row.
+    k : int
+        The largest number of levels that may be removed.
+
+    Returns
+    -------
+    bool
+        A boolean indicating if the row is safe once at most k levels are removed.
+
+    Raises
+    ------
+    ValueError
+        If k is negative.
+
+    """
+    if k < 0:
+        raise ValueError(f"Cannot remove a negative number of levels: {k}")
+    n = len(row)
+    if n <= k + 1:
+        # A single level is always safe.
+        return True
+
+    for sign in (1, -1):
+        # removals[j] is the fewest levels removed for a safe chain ending at j.
+        removals = []
+        for j in range(n):
+            best = j
+            for i in range(max(0, j - k - 1), j):
+                skipped = removals[i] + j - i - 1
+                if skipped < best and 1 <= sign * (row[j] - row[i]) <= 3:
+                    best = skipped
+            removals.append(best)
+            if best + n - 1 - j <= k:
+                return True
+    return False
+
+
+def solve_with_tolerance(filename: str = "input.txt", tolerance: int = 1) -> int:
+    """Count the rows that are safe once at most `tolerance` levels are removed.
+
+    Parameters
+    ----------
+    filename : str, optional
+        The name of the file to load data from (default is "input.txt").
+    tolerance : int, optional
+        The largest number of levels that may be removed from each row (default is
+        1). Tolerances of 0 and 1 give the answers to parts A and B.
+
+    Returns
+    -------
+    int
+        The number of safe rows in the data.
+
+    """
+    with stage("parse"):
+        data = load_data(filename)
+    with stage("search"):
+        return sum(is_safe_with_removals(row, tolerance) for row in data)
+
+
+def solve_part_a_dp(filename: str = "input.txt") -> int:
+    """Solve part A of the problem with `is_safe_with_removals`.
+
+    Parameters
+    ----------
+    filename : str, optional
+        The name of the file to load data from (default is "input.txt").
+
+    Returns
+    -------
+    int
+        The number of safe rows in the data.
+
+    """
+    return solve_with_tolerance(filename, tolerance=0)
+
+
+def solve_part_b_dp(filename: str = "input.txt") -> int:
+    """Solve part B of the problem with `is_safe_with_removals`.
+
+    Parameters
+    ----------
+    filename : str, optional
+        The name of the file to load data from (default is "input.txt").
+
+    Returns
+    -------
+    int
+        The number of safe rows in the data, allowing one element to be removed to make
+        the row safe.
+
+    """
+    return solve_with_tolerance(filename, tolerance=1)
+
+
 def solve_part_a(filename: str = "input.txt") -> int:
     """Solve part A of the problem.
 
@@ -101,8 +218,10 @@ def solve_part_a(filename: str = "input.txt") -> int:
         The number of safe rows in the data.
 
     """
-    data = load_data(filename)
-    return sum(is_safe(row) for row in data)
+    with stage("parse"):
+        data = load_data(filename)
+    with stage("search"):
+        return sum(is_safe(row) for row in data)
 
 
 def solve_part_b(filename: str = "input.txt") -> int:
@@ -120,8 +239,10 @@ def solve_part_b(filename: str = "input.txt") -> int:
         the row safe.
 
     """
-    data = load_data(filename)
-    return sum(is_safe(row, allow_dampened=True) for row in data)
+    with stage("parse"):
+        data = load_data(filename)
+    with stage("search"):
+        return sum(is_safe(row, allow_dampened=True) for row in data)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,13 @@
-from .sol import solve_part_a, solve_part_b
+import pytest
+
+from .sol import (
+    is_safe_with_removals,
+    solve_part_a,
+    solve_part_a_dp,
+    solve_part_b,
+    solve_part_b_dp,
+    solve_with_tolerance,
+)
 
 
 def test_solve_part_a():
@@ -9,3 +18,19 @@ def test_solve_part_a():
 def test_solve_part_b():
     part_b_expected_output = 4
     assert solve_part_b("test_input.txt") == part_b_expected_output
+
+
+def test_solve_dp():
+    assert solve_part_a_dp("test_input.txt") == 2
+    assert solve_part_b_dp("test_input.txt") == 4
+
+
+def test_is_safe_with_removals():
+    assert is_safe_with_removals([1, 3, 2, 4, 5], 1)
+    assert not is_safe_with_removals([1, 3, 2, 4, 5], 0)
+    # Two misplaced levels need two removals.
+    assert not is_safe_with_removals([1, 9, 2, 9, 3], 1)
+    assert is_safe_with_removals([1, 9, 2, 9, 3], 2)
+    assert solve_with_tolerance("test_input.txt", tolerance=5) == 6
+    with pytest.raises(ValueError):
+        is_safe_with_removals([1, 2], -1)
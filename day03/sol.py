@@ -1,23 +1,34 @@
 #!/usr/bin/env python3
 
 import re
+import sys
+from pathlib import Path
 
+if not __package__:
+    # Run as a script, so make the package importable for the relative imports below.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    __package__ = ".".join(Path(__file__).resolve().parts[-3:-1])
 
-def load_data(filename: str) -> str:
+from ..parse_cache import cached_loader
+from ..profiling import stage
+from ..sources import Source, read_text
+
+
+@cached_loader("pickle")
+def load_data(source: Source) -> str:
     """Load a file into a single string, replacing new lines with a new line symbol.
 
     Parameters
     ----------
-    filename : str
-        The name of the file to load data from.
+    source : Source
+        The file to load data from, or any input accepted by `sources.read_bytes`.
 
     Returns
     -------
     str
         A single string representing the contents of the file.
     """
-    with open(filename, "r") as file:
-        return file.read().replace("\n", "\\n")
+    return read_text(source).replace("\n", "\\n")
 
 
 def find_valid_mult_instances(s: str) -> list:
@@ -96,10 +107,13 @@ def solve_part_a(filename: str = "input.txt") -> int:
     int
         The total sum of all multiplications of `mul(x,y)` instances in the file.
     """
-    data = load_data(filename)
-    mult_instances = find_valid_mult_instances(data)
-    mult_results = calculate_mult_instances(mult_instances)
-    return sum(mult_results)
+    with stage("parse"):
+        data = load_data(filename)
+    with stage("search"):
+        mult_instances = find_valid_mult_instances(data)
+    with stage("reduce"):
+        mult_results = calculate_mult_instances(mult_instances)
+        return sum(mult_results)
 
 
 def solve_part_b(filename: str = "input.txt") -> int:
@@ -115,11 +129,14 @@ def solve_part_b(filename: str = "input.txt") -> int:
     int
         The total sum of all multiplications of `mul(x,y)` instances in the file after filtering.
     """
-    data = load_data(filename)
-    filtered_data = filter_for_conditionals(data)
-    mult_instances = find_valid_mult_instances(filtered_data)
-    mult_results = calculate_mult_instances(mult_instances)
-    return sum(mult_results)
+    with stage("parse"):
+        data = load_data(filename)
+    with stage("search"):
+        filtered_data = filter_for_conditionals(data)
+        mult_instances = find_valid_mult_instances(filtered_data)
+    with stage("reduce"):
+        mult_results = calculate_mult_instances(mult_instances)
+        return sum(mult_results)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,34 @@
 #!/usr/bin/env python3
-
+import sys
 from pathlib import Path
 
+if not __package__:
+    # Run as a script, so make the package importable for the relative imports below.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    __package__ = ".".join(Path(__file__).resolve().parts[-3:-1])
+
+from ..parse_cache import cached_loader
+from ..profiling import stage
+from ..sources import Source, iter_lines
+
+
+@cached_loader("grid")
+def load_grid(source: Source) -> list[list[str]]:
+    """Load the input file as a grid of characters.
+
+    Parameters
+    ----------
+    source : Source
+        The input file, or any input accepted by `sources.read_bytes`.
+
+    Returns
+    -------
+    list of list of str
+        The grid, one list of characters per line.
+
+    """
+    return [list(line.decode().strip()) for line in iter_lines(source)]
+
 
 def count_horizontal(grid: list[list[str]], word: str) -> int:
     """Count occurrences of a word horizontally in the grid.
@@ -322,10 +349,10 @@ def solve_part_a(filename: str = "input.txt") -> int:
         The result for part A.
 
     """
-    with Path(filename).open() as f:
-        grid = [list(line.strip()) for line in f]
-
-    return count_word_occurrences(grid, "XMAS")
+    with stage("parse"):
+        grid = load_grid(filename)
+    with stage("search"):
+        return count_word_occurrences(grid, "XMAS")
 
 
 def solve_part_b(filename: str = "input.txt") -> int:
@@ -342,10 +369,10 @@ def solve_part_b(filename: str = "input.txt") -> int:
         The result for part B.
 
     """
-    with Path(filename).open() as f:
-        grid = [list(line.strip()) for line in f]
-
-    return count_mas(grid)
+    with stage("parse"):
+        grid = load_grid(filename)
+    with stage("search"):
+        return count_mas(grid)
 
 
 if __name__ == "__main__":
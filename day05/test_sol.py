@@ -1,6 +1,23 @@
+import random
+
 import pytest
 
-from .sol import solve_part_a, solve_part_b
+from .sol import (
+    IncrementalValidator,
+    build_predecessor_masks,
+    load_rule_index,
+    parse_file,
+    parse_rules,
+    reorder_update,
+    save_rule_index,
+    select_middle_page,
+    solve_part_a,
+    solve_part_a_batch,
+    solve_part_b,
+    stream_updates,
+    update_is_valid,
+    validate_updates_batch,
+)
 
 
 def test_solve_part_a():
@@ -11,3 +28,146 @@ def test_solve_part_a():
 def test_solve_part_b():
     part_b_expected_output = 123
     assert solve_part_b("test_input.txt") == part_b_expected_output
+
+
+def test_solve_part_a_batch():
+    part_a_expected_output = 143
+    assert solve_part_a_batch("test_input.txt") == part_a_expected_output
+
+
+def test_validate_updates_batch_matches_update_is_valid():
+    list_of_constraints, list_of_updates = parse_file("test_input.txt")
+    valid, _ = validate_updates_batch(list_of_updates, list_of_constraints)
+    expected = [
+        update_is_valid(update, list_of_constraints) for update in list_of_updates
+    ]
+    assert valid.tolist() == expected
+
+
+def test_validate_updates_batch_empty_update():
+    valid, middle_page_sum = validate_updates_batch([[1, 2, 3], []], [(1, 2)])
+    assert valid.tolist() == [True, True]
+    assert middle_page_sum == 2
+
+
+def test_validate_updates_batch_chunks():
+    list_of_constraints, list_of_updates = parse_file("test_input.txt")
+    valid, middle_page_sum = validate_updates_batch(
+        list_of_updates, list_of_constraints, chunk_size=2
+    )
+    assert valid.tolist() == [True, True, True, False, False, False]
+    assert middle_page_sum == 143
+
+
+def test_stream_updates_running_sums(tmp_path):
+    _, list_of_updates = parse_file("test_input.txt")
+    lines = [",".join(map(str, update)) for update in list_of_updates]
+
+    snapshot = str(tmp_path / "rules.npy")
+    save_rule_index(load_rule_index("test_input.txt"), snapshot)
+
+    for rule_matrix in (load_rule_index("test_input.txt"), load_rule_index(snapshot)):
+        results = list(stream_updates(rule_matrix, lines))
+        assert [is_valid for _, is_valid, _, _, _ in results] == [
+            True,
+            True,
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert results[3][2] == [97, 75, 47, 61, 53]
+        assert results[-1][3:] == (143, 123)
+
+
+def _middle_page_sums(list_of_constraints, list_of_updates):
+    part_a = part_b = 0
+    for update in list_of_updates:
+        if update_is_valid(update, list_of_constraints):
+            part_a += update[len(update) // 2]
+        else:
+            part_b += reorder_update(update, list_of_constraints)[len(update) // 2]
+    return part_a, part_b
+
+
+def test_incremental_validator_follows_rule_changes():
+    list_of_constraints, list_of_updates = parse_file("test_input.txt")
+    validator = IncrementalValidator(list_of_constraints, list_of_updates)
+    assert (validator.part_a, validator.part_b) == (143, 123)
+
+    rng = random.Random(0)
+    removed = []
+    for _ in range(200):
+        if removed and rng.random() < 0.5:
+            validator.add_rule(*removed.pop(rng.randrange(len(removed))))
+        else:
+            rule = rng.choice(list(validator.rules))
+            validator.remove_rule(*rule)
+            removed.append(rule)
+        expected = _middle_page_sums(list(validator.rules), list_of_updates)
+        assert (validator.part_a, validator.part_b) == expected
+
+
+def test_incremental_validator_rejects_invalid_rules():
+    validator = IncrementalValidator([(1, 2)], [[2, 1, 3]])
+    assert (validator.part_a, validator.part_b) == (0, 2)
+    with pytest.raises(ValueError):
+        validator.add_rule(3, 3)
+    with pytest.raises(KeyError):
+        validator.remove_rule(2, 1)
+    validator.remove_rule(1, 2)
+    assert (validator.part_a, validator.part_b) == (1, 0)
+
+
+def test_select_middle_page_matches_reordering():
+    list_of_constraints, list_of_updates = parse_file("test_input.txt")
+    predecessor_masks = build_predecessor_masks(list_of_constraints)
+    for update in list_of_updates:
+        corrected_update = reorder_update(update, list_of_constraints)
+        assert (
+            select_middle_page(update, predecessor_masks)
+            == corrected_update[len(update) // 2]
+        )
+    assert reorder_update([97, 13, 75, 29, 47], list_of_constraints) == [
+        97,
+        75,
+        47,
+        29,
+        13,
+    ]
+
+
+def test_select_middle_page_needs_ordered_pages():
+    with pytest.raises(ValueError):
+        select_middle_page([1, 2, 3], build_predecessor_masks([]))
+
+
+@pytest.mark.parametrize(
+    "content, expected_output",
+    [
+        ("2|1\n\n1,2,4,5,6\n", 4),
+        # Page 2 has one predecessor, but the reordered update is 1,5,2.
+        ("1|2\n\n2,5,1\n", 5),
+        ("-2|1\n\n1,-2\n", 1),
+        ("1000000000|1\n1|7\n\n7,1,1000000000\n", 1),
+    ],
+)
+def test_solve_part_b_partial_order(tmp_path, content, expected_output):
+    filename = tmp_path / "input.txt"
+    filename.write_text(content)
+    assert solve_part_b(str(filename)) == expected_output
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"1,2\n\n1,2,3\n", b"1|2\n\n1|2\n", b"1 2\n\n1,2\n", b"1|2|3\n\n1,2\n", b"1|2\n"],
+)
+def test_parse_file_rejects_mixed_separators(content):
+    with pytest.raises(ValueError):
+        parse_file(content)
+
+
+def test_parse_rules():
+    assert parse_rules("47|53\r\n97|13\n\n75,47\n") == [(47, 53), (97, 13)]
+    with pytest.raises(ValueError):
+        parse_rules("47,53\n")
@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 
+import bisect
+import sys
+from collections.abc import Iterable
 from pathlib import Path
-from pprint import pprint
 
+if not __package__:
+    # Run as a script, so make the package importable for the relative imports below.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    __package__ = ".".join(Path(__file__).resolve().parts[-3:-1])
 
-def load_input(filename: str = "input.txt") -> list[list[str]]:
+from ..parse_cache import cached_index, cached_loader
+from ..profiling import stage
+from ..sources import Source, iter_lines, read_bytes
+
+
+@cached_loader("grid")
+def load_input(source: Source = "input.txt") -> list[list[str]]:
     """Load the input file and convert it to a grid represented as a list of lists.
 
     Parameters
     ----------
-    filename : str, optional
-        The name of the input file to read, by default 'test_input.txt'
+    source : Source, optional
+        The input file to read, or any input accepted by `sources.read_bytes`, by
+        default 'input.txt'
 
     Returns
     -------
@@ -19,10 +32,9 @@ def load_input(filename: str = "input.txt") -> list[list[str]]:
 
     """
     grid = []
-    with Path(filename).open() as f:
-        for line in f:
-            line = line.rstrip("\n")
-            grid.append(list(line))
+    for line in iter_lines(source):
+        line = line.decode().rstrip("\r\n")
+        grid.append(list(line))
     return grid
 
 
@@ -266,13 +278,16 @@ def solve_part_a(filename: str = "input.txt") -> int:
         The number of intersections visited.
 
     """
-    grid = load_input(filename)
-    current_location, current_direction = find_start_location_and_direction(grid)
-    mark_location_as_visited(current_location, grid)
+    with stage("parse"):
+        grid = load_input(filename)
+    with stage("search"):
+        current_location, current_direction = find_start_location_and_direction(grid)
+        mark_location_as_visited(current_location, grid)
 
-    traverse_grid_until_out(current_location, current_direction, grid)
+        traverse_grid_until_out(current_location, current_direction, grid)
 
-    return count_visited_locations(grid)
+    with stage("reduce"):
+        return count_visited_locations(grid)
 
 
 def solve_part_b(filename: str = "input.txt") -> int:
@@ -289,58 +304,267 @@ def solve_part_b(filename: str = "input.txt") -> int:
         The number of intersections visited.
 
     """
-    grid = load_input(filename)
-    current_location, current_direction = find_start_location_and_direction(grid)
-    mark_location_as_visited(current_location, grid)
-    og_traversed_grid = traverse_grid_until_out(
-        current_location,
-        current_direction,
-        [row.copy() for row in grid],
-        return_grid=True,
-    )
-
-    counter = 0
-    no_obstructions = 0
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if (  # There's no point in adding an obstacle in positions not visited
-                og_traversed_grid[i][j] != "X"
-            ):
-                continue
-            counter += 1
-            if counter % 10 == 0:
-                print(f"Counter: {counter}")
-
-            new_grid = load_input(filename)
-            current_location, current_direction = find_start_location_and_direction(
-                new_grid,
-            )
-            visited_locations_and_directions = ((current_location, current_direction),)
-
-            # Add an obstacle
-            mark_location_as_obstacle((i, j), new_grid)
-
-            while True:
-                next_location, next_direction = take_one_step(
-                    current_location,
-                    current_direction,
+    with stage("parse"):
+        # Kept to reload a fresh grid for every obstacle, as the input may be a stream.
+        data = read_bytes(filename)
+        grid = load_input(data)
+    with stage("index"):
+        current_location, current_direction = find_start_location_and_direction(grid)
+        mark_location_as_visited(current_location, grid)
+        og_traversed_grid = traverse_grid_until_out(
+            current_location,
+            current_direction,
+            [row.copy() for row in grid],
+            return_grid=True,
+        )
+
+    with stage("search"):
+        counter = 0
+        no_obstructions = 0
+        for i in range(len(grid)):
+            for j in range(len(grid[0])):
+                if (  # There's no point in adding an obstacle in positions not visited
+                    og_traversed_grid[i][j] != "X"
+                ):
+                    continue
+                counter += 1
+                if counter % 10 == 0:
+                    print(f"Counter: {counter}")
+
+                new_grid = load_input(data)
+                current_location, current_direction = find_start_location_and_direction(
                     new_grid,
                 )
-                if next_location is None:
-                    break
-                current_location, current_direction = next_location, next_direction
-                if (
-                    current_location,
-                    current_direction,
-                ) in visited_locations_and_directions:
-                    no_obstructions += 1
-                    break
-                visited_locations_and_directions += (
+                visited_locations_and_directions = (
                     (current_location, current_direction),
                 )
+
+                # Add an obstacle
+                mark_location_as_obstacle((i, j), new_grid)
+
+                while True:
+                    next_location, next_direction = take_one_step(
+                        current_location,
+                        current_direction,
+                        new_grid,
+                    )
+                    if next_location is None:
+                        break
+                    current_location, current_direction = next_location, next_direction
+                    if (
+                        current_location,
+                        current_direction,
+                    ) in visited_locations_and_directions:
+                        no_obstructions += 1
+                        break
+                    visited_locations_and_directions += (
+                        (current_location, current_direction),
+                    )
     return no_obstructions
 
 
+# Directions in clockwise order, so that turning right moves to the next one
+DIRECTIONS = "urdl"
+
+# The state of a guard that walked off the grid
+EXIT = -1
+
+
+class ObstacleQueryEngine:
+    """Answer whether added obstacles trap the guard, for many sets of obstacles on
+    the same map.
+
+    The map is indexed once into jump tables giving, for every cell and direction,
+    the last cell the guard reaches before an obstacle or the edge of the grid.
+    These are the edges of a graph of turn states, a turn state being a cell and the
+    direction in which the guard is blocked there. A query only patches the edges
+    walking along the rows and columns of its added obstacles, and runs Brent's cycle
+    detection over the patched graph, so it takes time proportional to the number of
+    turns rather than the number of cells walked, and constant memory.
+
+    Parameters
+    ----------
+    grid : list[list[str]]
+        The grid as returned by `load_input`.
+
+    """
+
+    def __init__(self, grid: list[list[str]]) -> None:
+        self.height = len(grid)
+        self.width = len(grid[0]) if grid else 0
+        (i, j), direction = find_start_location_and_direction(grid)
+        self.start = i * self.width + j
+        self.start_direction = DIRECTIONS.index(direction)
+        # The distance between neighbouring cells in each direction
+        self.steps = (-self.width, 1, self.width, -1)
+
+        # stops[d][cell] is the last cell reached walking from cell in direction d,
+        # or EXIT. Each line is scanned once, against the direction of the walk.
+        self.stops = [[EXIT] * (self.height * self.width) for _ in DIRECTIONS]
+        for direction, step in enumerate(self.steps):
+            stops = self.stops[direction]
+            for line in self._rows() if direction % 2 else self._columns():
+                stop = EXIT
+                for cell in reversed(line) if step > 0 else line:
+                    if is_obstacle(divmod(cell, self.width), grid):
+                        stop = None
+                        continue
+                    if stop is None:
+                        stop = cell
+                    stops[cell] = stop
+
+    def _rows(self) -> list[range]:
+        return [range(i * self.width, (i + 1) * self.width) for i in range(self.height)]
+
+    def _columns(self) -> list[range]:
+        return [
+            range(j, self.height * self.width, self.width) for j in range(self.width)
+        ]
+
+    def _walk(
+        self,
+        cell: int,
+        direction: int,
+        added_in_rows: dict[int, list[int]],
+        added_in_columns: dict[int, list[int]],
+    ) -> int:
+        """Return the last cell reached walking from a cell, or EXIT."""
+        stop = self.stops[direction][cell]
+        i, j = divmod(cell, self.width)
+        horizontal = direction % 2 == 1
+        added = added_in_rows.get(i) if horizontal else added_in_columns.get(j)
+        if not added:
+            return stop
+
+        # The patched edge ends before the nearest added obstacle ahead, if it comes
+        # before the end of the original edge.
+        position = j if horizontal else i
+        forward = self.steps[direction] > 0
+        if stop != EXIT:
+            end = stop % self.width if horizontal else stop // self.width
+        elif forward:
+            end = (self.width if horizontal else self.height) - 1
+        else:
+            end = 0
+        if forward:
+            index = bisect.bisect_right(added, position)
+            if index < len(added) and added[index] <= end:
+                return cell + (added[index] - position - 1) * self.steps[direction]
+        else:
+            index = bisect.bisect_left(added, position) - 1
+            if index >= 0 and added[index] >= end:
+                return cell + (position - added[index] - 1) * self.steps[direction]
+        return stop
+
+    def is_trapped(self, obstacles: Iterable[tuple[int, int]]) -> bool:
+        """Determine whether the guard walks in a loop once obstacles are added.
+
+        Parameters
+        ----------
+        obstacles : Iterable[tuple[int, int]]
+            The locations of the added obstacles as (i, j).
+
+        Returns
+        -------
+        bool
+            True if the guard never leaves the grid.
+
+        Raises
+        ------
+        ValueError
+            If an obstacle lies outside the grid.
+
+        """
+        added_in_rows: dict[int, list[int]] = {}
+        added_in_columns: dict[int, list[int]] = {}
+        for i, j in obstacles:
+            if not (0 <= i < self.height and 0 <= j < self.width):
+                raise ValueError(f"Obstacle outside the grid: {(i, j)}")
+            added_in_rows.setdefault(i, []).append(j)
+            added_in_columns.setdefault(j, []).append(i)
+        for added in (*added_in_rows.values(), *added_in_columns.values()):
+            added.sort()
+
+        def turn(state: int) -> int:
+            cell, direction = divmod(state, 4)
+            direction = (direction + 1) % 4
+            stop = self._walk(cell, direction, added_in_rows, added_in_columns)
+            return EXIT if stop == EXIT else stop * 4 + direction
+
+        stop = self._walk(
+            self.start, self.start_direction, added_in_rows, added_in_columns
+        )
+        if stop == EXIT:
+            return False
+
+        # Brent's algorithm: the tortoise waits at powers of two for the hare.
+        tortoise = stop * 4 + self.start_direction
+        hare = turn(tortoise)
+        power = length = 1
+        while hare != tortoise:
+            if hare == EXIT:
+                return False
+            if power == length:
+                tortoise = hare
+                power *= 2
+                length = 0
+            hare = turn(hare)
+            length += 1
+        return True
+
+
+@cached_index
+def build_obstacle_engine(grid: list[list[str]]) -> ObstacleQueryEngine:
+    """Build the `ObstacleQueryEngine` of a map, reused for the same map by processes
+    that keep indexes in memory.
+
+    Parameters
+    ----------
+    grid : list[list[str]]
+        The map, holding exactly one guard.
+
+    Returns
+    -------
+    ObstacleQueryEngine
+        The engine, which must not be modified.
+
+    """
+    return ObstacleQueryEngine(grid)
+
+
+def solve_part_b_turn_graph(filename: str = "input.txt") -> int:
+    """Solve part B of the puzzle with one `ObstacleQueryEngine` query per obstacle.
+
+    Parameters
+    ----------
+    filename : str, optional
+        The name of the input file to read, by default 'input.txt'
+
+    Returns
+    -------
+    int
+        The number of locations where an obstacle traps the guard.
+
+    """
+    with stage("parse"):
+        grid = load_input(filename)
+    with stage("index"):
+        engine = build_obstacle_engine(grid)
+        start, direction = find_start_location_and_direction(grid)
+        # Obstacles off the guard's path cannot change it.
+        walked = traverse_grid_until_out(
+            start, direction, [row.copy() for row in grid], return_grid=True
+        )
+        candidates = [
+            (i, j)
+            for i, row in enumerate(walked)
+            for j, cell in enumerate(row)
+            if cell == "X" and (i, j) != start
+        ]
+    with stage("search"):
+        return sum(engine.is_trapped([candidate]) for candidate in candidates)
+
+
 if __name__ == "__main__":
     result = solve_part_b(filename="input.txt")
     print(str(result))
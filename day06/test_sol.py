@@ -1,6 +1,12 @@
 import pytest
 
-from .sol import solve_part_a, solve_part_b
+from .sol import (
+    ObstacleQueryEngine,
+    load_input,
+    solve_part_a,
+    solve_part_b,
+    solve_part_b_turn_graph,
+)
 
 
 def test_solve_part_a():
@@ -11,3 +17,22 @@ def test_solve_part_a():
 def test_solve_part_b():
     part_b_expected_output = 6
     assert solve_part_b("test_input.txt") == part_b_expected_output
+
+
+def test_solve_part_b_turn_graph():
+    part_b_expected_output = 6
+    assert solve_part_b_turn_graph("test_input.txt") == part_b_expected_output
+
+
+def test_obstacle_query_engine():
+    engine = ObstacleQueryEngine(load_input("test_input.txt"))
+    assert not engine.is_trapped([])
+    assert engine.is_trapped([(6, 3)])
+    assert not engine.is_trapped([(1, 4)])
+    # An obstacle off the guard's path changes nothing.
+    assert engine.is_trapped([(6, 3), (0, 0)])
+    # A guard boxed in where it starts turns in place forever.
+    assert not engine.is_trapped([(5, 4), (6, 5), (7, 4)])
+    assert engine.is_trapped([(5, 4), (6, 5), (7, 4), (6, 3)])
+    with pytest.raises(ValueError):
+        engine.is_trapped([(10, 0)])
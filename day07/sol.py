@@ -1,16 +1,44 @@
 #!/usr/bin/env python3
+import os
+import re
+import sys
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-import numpy as np
+if TYPE_CHECKING:
+    # Only the batch engine needs NumPy, which is slow to import.
+    import numpy as np
 
+if not __package__:
+    # Run as a script, so make the package importable for the relative imports below.
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    __package__ = ".".join(Path(__file__).resolve().parts[-3:-1])
 
-def parse_file(filename: str) -> list[tuple[int, tuple[int, ...]]]:
+from ..intparse import DEFAULT_SEPARATORS, parse_int_rows
+from ..parse_cache import cached_loader
+from ..profiling import stage
+from ..sources import Source, read_bytes
+
+# Classes returned by `classify_equation`
+UNSOLVABLE = 0
+SOLVABLE_WITHOUT_CONCAT = 1
+SOLVABLE_ONLY_WITH_CONCAT = 2
+
+# Lines are blank or hold a test value, a colon and the numbers, which are checked
+# when they are tokenized
+_EQUATION_LINE = rb"[ \t\r]*(?:-?\d+[ \t\r]*:[^:\n]*)?"
+EQUATIONS_PATTERN = re.compile(rb"%s(?:\n%s)*" % (_EQUATION_LINE, _EQUATION_LINE))
+
+
+@cached_loader("pickle")
+def parse_file(source: Source) -> list[tuple[int, tuple[int, ...]]]:
     """Parse the specified file and return a list of tuples.
 
     Parameters
     ----------
-    filename : str
-        The path to the file to parse.
+    source : Source
+        The path to the file to parse, or any input accepted by `sources.read_bytes`.
 
     Returns
     -------
@@ -18,14 +46,18 @@ def parse_file(filename: str) -> list[tuple[int, tuple[int, ...]]]:
         A list of tuples where each tuple represents an (x, (y1, y2, ...)) pair from
         the file.
 
+    Raises
+    ------
+    ValueError
+        If a line is not blank and does not hold a test value followed by a colon
+        and integers.
+
     """
-    list_of_tuples = []
-    with Path(filename).open() as file:
-        for line in file:
-            key, values = line.split(":")
-            values_tuple = tuple(map(int, values.split()))
-            list_of_tuples.append((int(key), values_tuple))
-    return list_of_tuples
+    content = read_bytes(source)
+    if not EQUATIONS_PATTERN.fullmatch(content):
+        raise ValueError("Each line must hold a test value, a colon and numbers")
+    rows = parse_int_rows(content, DEFAULT_SEPARATORS + b":")
+    return [(row[0], tuple(row[1:])) for row in rows if row]
 
 
 def can_form_target(
@@ -123,6 +155,542 @@ def can_form_target_with_concat(
     return False
 
 
+def can_form_target_backward(
+    nums: list[int],
+    target: int,
+    allow_concat: bool = False,
+    index: int | None = None,
+) -> bool:
+    """Determine if the target value can be formed by working backward from it.
+
+    Each operator is undone on the last number, and a branch is only followed when
+    the inverse is exact: subtraction must not go below zero, division must leave no
+    remainder and un-concatenation requires the target to end with the number.
+
+    Parameters
+    ----------
+    nums : list[int]
+        The list of numbers to use.
+    target : int
+        The target value to form.
+    allow_concat : bool, optional
+        Whether concatenation may be used as well, by default False.
+    index : int, optional
+        The index of the last number still to be undone, by default the last index.
+
+    Returns
+    -------
+    bool
+        True if the target value can be formed, False otherwise.
+
+    """
+    if index is None:
+        index = len(nums) - 1
+
+    # Base case: Only the first number is left
+    if index == 0:
+        return target == nums[0]
+
+    last_num = nums[index]
+
+    # Multiplication
+    if last_num == 0:
+        if target == 0:
+            return True
+    elif target % last_num == 0 and can_form_target_backward(
+        nums, target // last_num, allow_concat, index - 1
+    ):
+        return True
+
+    if target < last_num:
+        # Addition and concatenation both yield at least the last number.
+        return False
+
+    # Concatenation: a || b == a * 10**digits(b) + b
+    if allow_concat:
+        shift = 10 ** len(str(last_num))
+        if (target - last_num) % shift == 0 and can_form_target_backward(
+            nums, (target - last_num) // shift, allow_concat, index - 1
+        ):
+            return True
+
+    # Addition
+    return can_form_target_backward(nums, target - last_num, allow_concat, index - 1)
+
+
+def _search_tables(nums: list[int]) -> tuple[list[int], list[bool]]:
+    """Return the power of ten concatenating each number shifts by, and whether
+    values may be pruned above the target before each position, as values never
+    decrease except when multiplied by a later zero."""
+    shifts = [10 ** len(str(num)) for num in nums]
+    can_prune = [True] * (len(nums) + 1)
+    for index in range(len(nums) - 1, -1, -1):
+        can_prune[index] = can_prune[index + 1] and nums[index] != 0
+    return shifts, can_prune
+
+
+def can_form_target_iterative(
+    nums: list[int],
+    target: int,
+    allow_concat: bool = False,
+) -> bool:
+    """Determine if the target value can be formed, using an explicit stack instead of
+    recursion so that equations with hundreds of numbers can be checked.
+
+    Concatenation is done arithmetically with a power of ten precomputed for each
+    number, and branches are dropped as soon as their value exceeds the target unless
+    a zero is still to come. States already explored are skipped, so that the search
+    takes at most one step per distinct value at each position instead of one per
+    operator combination.
+
+    Parameters
+    ----------
+    nums : list[int]
+        The list of numbers to use.
+    target : int
+        The target value to form.
+    allow_concat : bool, optional
+        Whether concatenation may be used as well, by default False.
+
+    Returns
+    -------
+    bool
+        True if the target value can be formed, False otherwise.
+
+    """
+    count = len(nums)
+    shifts, can_prune = _search_tables(nums)
+
+    values = [nums[0]]
+    indices = [1]
+    # States are packed into single integers, which hash faster than tuples.
+    stride = count + 1
+    seen = set()
+    while values:
+        value = values.pop()
+        index = indices.pop()
+        state = value * stride + index
+        if state in seen:
+            continue
+        seen.add(state)
+        if index == count:
+            if value == target:
+                return True
+            continue
+        if value > target and can_prune[index]:
+            continue
+
+        next_num = nums[index]
+        index += 1
+        if allow_concat:
+            values.append(value * shifts[index - 1] + next_num)
+            indices.append(index)
+        values.append(value * next_num)
+        indices.append(index)
+        # Addition is pushed last so that it is explored first.
+        values.append(value + next_num)
+        indices.append(index)
+
+    return False
+
+
+def classify_equation(nums: list[int], target: int) -> int:
+    """Classify an equation with a single walk of the operator search tree.
+
+    Every node tracks whether concatenation was used on the way to it. Once a
+    solution using concatenation is found, only branches without it are still worth
+    expanding, and the walk stops at the first solution without it. As in
+    `can_form_target_iterative`, explored states are skipped, a state reached
+    without concatenation covering the same state reached with it.
+
+    Parameters
+    ----------
+    nums : list[int]
+        The list of numbers to use.
+    target : int
+        The target value to form.
+
+    Returns
+    -------
+    int
+        `SOLVABLE_WITHOUT_CONCAT` if addition and multiplication suffice,
+        `SOLVABLE_ONLY_WITH_CONCAT` if concatenation is needed and `UNSOLVABLE`
+        otherwise.
+
+    """
+    count = len(nums)
+    shifts, can_prune = _search_tables(nums)
+
+    found_with_concat = False
+    values = [nums[0]]
+    indices = [1]
+    used_concat = [False]
+    # States are packed as in `can_form_target_iterative`, with a last bit set if
+    # concatenation was used.
+    stride = count + 1
+    seen = set()
+    while values:
+        value = values.pop()
+        index = indices.pop()
+        concat_so_far = used_concat.pop()
+        if concat_so_far and found_with_concat:
+            continue
+        state = (value * stride + index) * 2
+        if state in seen or (concat_so_far and state + 1 in seen):
+            continue
+        seen.add(state + concat_so_far)
+        if index == count:
+            if value == target:
+                if not concat_so_far:
+                    return SOLVABLE_WITHOUT_CONCAT
+                found_with_concat = True
+            continue
+        if value > target and can_prune[index]:
+            continue
+
+        next_num = nums[index]
+        index += 1
+        values.append(value * shifts[index - 1] + next_num)
+        indices.append(index)
+        used_concat.append(True)
+        values.append(value * next_num)
+        indices.append(index)
+        used_concat.append(concat_so_far)
+        values.append(value + next_num)
+        indices.append(index)
+        used_concat.append(concat_so_far)
+
+    return SOLVABLE_ONLY_WITH_CONCAT if found_with_concat else UNSOLVABLE
+
+
+def can_form_targets_batch(
+    equations: list[tuple[int, tuple[int, ...]]],
+    allow_concat: bool = False,
+    chunk_size: int = 4096,
+) -> "np.ndarray":
+    """Determine which equations can be formed, expanding the reachable values of many
+    equations at once with NumPy.
+
+    Equations are grouped by their number of operands. For each group the frontier
+    holds every distinct value reachable so far, tagged with the row of its equation,
+    and is expanded by each operator as array operations, dropping values above the
+    row's target. Rows whose values could overflow int64, or that contain numbers
+    below one and so cannot be pruned by value, fall back to
+    `can_form_target_iterative`.
+
+    Parameters
+    ----------
+    equations : list[tuple[int, tuple[int, ...]]]
+        The equations as returned by `parse_file`.
+    allow_concat : bool, optional
+        Whether concatenation may be used as well, by default False.
+    chunk_size : int, optional
+        The number of equations expanded together, which bounds the frontier size,
+        by default 4096.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean mask with one entry per equation, True if it can be formed.
+
+    """
+    import numpy as np
+
+    int64_max = np.iinfo(np.int64).max
+    solved = np.zeros(len(equations), dtype=bool)
+
+    rows_by_length: dict[int, list[int]] = {}
+    for row, (test_value, remaining_numbers) in enumerate(equations):
+        largest_step = max(
+            max(remaining_numbers),
+            (
+                max(10 ** len(str(num)) for num in remaining_numbers)
+                if allow_concat
+                else 0
+            ),
+        )
+        if (
+            min(remaining_numbers) <= 0
+            or test_value <= 0
+            or test_value * largest_step + max(remaining_numbers) > int64_max
+        ):
+            solved[row] = can_form_target_iterative(
+                list(remaining_numbers), test_value, allow_concat
+            )
+        else:
+            rows_by_length.setdefault(len(remaining_numbers), []).append(row)
+
+    for group in rows_by_length.values():
+        for start in range(0, len(group), chunk_size):
+            chunk = group[start : start + chunk_size]
+            targets = np.array([equations[row][0] for row in chunk], dtype=np.int64)
+            nums = np.array([equations[row][1] for row in chunk], dtype=np.int64)
+            solved[chunk] = _expand_frontier(targets, nums, allow_concat)
+
+    return solved
+
+
+def _expand_frontier(
+    targets: "np.ndarray", nums: "np.ndarray", allow_concat: bool
+) -> "np.ndarray":
+    """Expand the reachable values of equations sharing the same number of operands.
+
+    Parameters
+    ----------
+    targets : np.ndarray
+        The target of each equation.
+    nums : np.ndarray
+        The numbers of each equation, one row per equation.
+    allow_concat : bool
+        Whether concatenation may be used as well.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean mask with one entry per equation, True if it can be formed.
+
+    """
+    import numpy as np
+
+    shifts = np.full_like(nums, 10)
+    while (too_small := nums >= shifts).any():
+        shifts[too_small] *= 10
+
+    rows = np.arange(len(targets))
+    values = nums[:, 0].copy()
+    for position in range(1, nums.shape[1]):
+        keep = values <= targets[rows]
+        rows, values = rows[keep], values[keep]
+
+        next_nums = nums[rows, position]
+        candidates = [values + next_nums, values * next_nums]
+        if allow_concat:
+            candidates.append(values * shifts[rows, position] + next_nums)
+        values = np.concatenate(candidates)
+        rows = np.tile(rows, len(candidates))
+
+        # Drop duplicate (row, value) pairs so that the frontier stays small.
+        order = np.lexsort((values, rows))
+        rows, values = rows[order], values[order]
+        distinct = np.ones(len(rows), dtype=bool)
+        distinct[1:] = (rows[1:] != rows[:-1]) | (values[1:] != values[:-1])
+        rows, values = rows[distinct], values[distinct]
+
+    solved = np.zeros(len(targets), dtype=bool)
+    solved[rows[values == targets[rows]]] = True
+    return solved
+
+
+class Operator(NamedTuple):
+    """An operator that can be placed between two numbers of an equation.
+
+    Attributes
+    ----------
+    forward : Callable[[int, int], int]
+        Combines the value so far with the next number.
+    inverse : Callable[[int, int], int | None] | None
+        Given a result and the last number, returns the value before the operator
+        was applied, or None if no value can produce the result. Operators without
+        an inverse cannot be used in the backward search.
+    monotonic : bool
+        Whether the result is never smaller than the value so far when the next
+        number is positive, which allows pruning values above the target.
+
+    """
+
+    forward: Callable[[int, int], int]
+    inverse: Callable[[int, int], int | None] | None = None
+    monotonic: bool = False
+
+
+OPERATORS: dict[str, Operator] = {}
+
+
+def register_operator(
+    name: str,
+    forward: Callable[[int, int], int],
+    inverse: Callable[[int, int], int | None] | None = None,
+    monotonic: bool = False,
+) -> None:
+    """Register an operator for use by the registry-based solvers.
+
+    Parameters
+    ----------
+    name : str
+        The name the operator is selected by, e.g. "+".
+    forward : Callable[[int, int], int]
+        Combines the value so far with the next number.
+    inverse : Callable[[int, int], int | None], optional
+        Undoes the operator for the backward search, by default None.
+    monotonic : bool, optional
+        Whether values above the target can be pruned, by default False.
+
+    """
+    OPERATORS[name] = Operator(forward, inverse, monotonic)
+
+
+def _concat(left: int, right: int) -> int:
+    return left * 10 ** len(str(right)) + right
+
+
+def _undo_add(result: int, right: int) -> int | None:
+    return result - right if result >= right else None
+
+
+def _undo_mul(result: int, right: int) -> int | None:
+    return result // right if result % right == 0 else None
+
+
+def _undo_concat(result: int, right: int) -> int | None:
+    shift = 10 ** len(str(right))
+    if result < right or (result - right) % shift != 0:
+        return None
+    return (result - right) // shift
+
+
+register_operator("+", lambda left, right: left + right, _undo_add, monotonic=True)
+register_operator("*", lambda left, right: left * right, _undo_mul, monotonic=True)
+register_operator("||", _concat, _undo_concat, monotonic=True)
+
+
+def can_form_target_with_operators(
+    nums: list[int],
+    target: int,
+    operator_names: Sequence[str] = ("+", "*"),
+) -> bool:
+    """Determine if the target value can be formed with the registered operators.
+
+    The search runs backward from the target when every operator has an inverse and
+    every number is positive, and forward otherwise.
+
+    Parameters
+    ----------
+    nums : list[int]
+        The list of numbers to use.
+    target : int
+        The target value to form.
+    operator_names : Sequence[str], optional
+        The names of the registered operators to use, by default ("+", "*").
+
+    Returns
+    -------
+    bool
+        True if the target value can be formed, False otherwise.
+
+    """
+    operators = [OPERATORS[name] for name in operator_names]
+
+    if min(nums) > 0 and all(operator.inverse is not None for operator in operators):
+        targets = [target]
+        indices = [len(nums) - 1]
+        while targets:
+            value = targets.pop()
+            index = indices.pop()
+            if index == 0:
+                if value == nums[0]:
+                    return True
+                continue
+            for operator in operators:
+                previous_value = operator.inverse(value, nums[index])
+                if previous_value is not None:
+                    targets.append(previous_value)
+                    indices.append(index - 1)
+        return False
+
+    can_prune = min(nums[1:], default=1) > 0 and all(
+        operator.monotonic for operator in operators
+    )
+    values = [nums[0]]
+    indices = [1]
+    while values:
+        value = values.pop()
+        index = indices.pop()
+        if index == len(nums):
+            if value == target:
+                return True
+            continue
+        if can_prune and value > target:
+            continue
+        for operator in operators:
+            values.append(operator.forward(value, nums[index]))
+            indices.append(index + 1)
+    return False
+
+
+class _PrefixNode:
+    """A node of the operand trie built by `solve_with_prefix_trie`."""
+
+    __slots__ = ("children", "ending_rows", "max_target", "can_prune")
+
+    def __init__(self) -> None:
+        self.children: dict[int, _PrefixNode] = {}
+        self.ending_rows: list[int] = []
+        self.max_target = 0
+        self.can_prune = True
+
+
+def solve_with_prefix_trie(
+    equations: list[tuple[int, tuple[int, ...]]],
+    operator_names: Sequence[str] = ("+", "*"),
+) -> list[bool]:
+    """Determine which equations can be formed, sharing work between equations whose
+    numbers start the same way.
+
+    The numbers of all equations are inserted into a trie. The set of values
+    reachable for each prefix is computed once, at its trie node, and reused by every
+    equation sharing that prefix. When all operators are monotonic, values above the
+    largest target below a node are dropped.
+
+    Parameters
+    ----------
+    equations : list[tuple[int, tuple[int, ...]]]
+        The equations as returned by `parse_file`.
+    operator_names : Sequence[str], optional
+        The names of the registered operators to use, by default ("+", "*").
+
+    Returns
+    -------
+    list[bool]
+        One entry per equation, True if it can be formed.
+
+    """
+    operators = [OPERATORS[name] for name in operator_names]
+    all_monotonic = all(operator.monotonic for operator in operators)
+
+    root = _PrefixNode()
+    for row, (test_value, remaining_numbers) in enumerate(equations):
+        node = root
+        for position, num in enumerate(remaining_numbers):
+            node = node.children.setdefault(num, _PrefixNode())
+            node.max_target = max(node.max_target, test_value)
+            # Values can only be pruned if no later number can shrink them.
+            if min(remaining_numbers[position + 1 :], default=1) <= 0:
+                node.can_prune = False
+        node.ending_rows.append(row)
+
+    solved = [False] * len(equations)
+    # Each entry holds a node and the values reachable once its number is used.
+    stack = [(child, {num}) for num, child in root.children.items()]
+    while stack:
+        node, reachable = stack.pop()
+        if all_monotonic and node.can_prune:
+            reachable = {value for value in reachable if value <= node.max_target}
+        for row in node.ending_rows:
+            solved[row] = equations[row][0] in reachable
+        for num, child in node.children.items():
+            stack.append(
+                (
+                    child,
+                    {
+                        operator.forward(value, num)
+                        for value in reachable
+                        for operator in operators
+                    },
+                )
+            )
+    return solved
+
+
 def solve_part_a(filename: str) -> int:
     """Solve part A of the day.
 
@@ -137,12 +705,14 @@ def solve_part_a(filename: str) -> int:
         The solution to part A.
 
     """
-    input_list = parse_file(filename)
+    with stage("parse"):
+        input_list = parse_file(filename)
     total_calibration_result = 0
 
-    for test_value, remaining_numbers in input_list:
-        if can_form_target(list(remaining_numbers), test_value):
-            total_calibration_result += test_value
+    with stage("search"):
+        for test_value, remaining_numbers in input_list:
+            if can_form_target(list(remaining_numbers), test_value):
+                total_calibration_result += test_value
 
     return total_calibration_result
 
@@ -161,20 +731,383 @@ def solve_part_b(filename: str) -> int:
         The solution to part A.
 
     """
-    input_list = parse_file(filename)
+    with stage("parse"):
+        input_list = parse_file(filename)
     total_calibration_result = 0
 
-    for test_value, remaining_numbers in input_list:
-        # Attempt to first form the target without using concat as it's a lot faster.
-        if can_form_target(
-            list(remaining_numbers),
-            test_value,
-        ) or can_form_target_with_concat(list(remaining_numbers), test_value):
-            total_calibration_result += test_value
+    with stage("search"):
+        for test_value, remaining_numbers in input_list:
+            # Attempt to first form the target without using concat as it's a lot
+            # faster.
+            if can_form_target(
+                list(remaining_numbers),
+                test_value,
+            ) or can_form_target_with_concat(list(remaining_numbers), test_value):
+                total_calibration_result += test_value
 
     return total_calibration_result
 
 
+def solve_part_a_backward(filename: str) -> int:
+    """Solve part A of the day using the backward search.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part A.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        return sum(
+            test_value
+            for test_value, remaining_numbers in input_list
+            if can_form_target_backward(list(remaining_numbers), test_value)
+        )
+
+
+def solve_part_b_backward(filename: str) -> int:
+    """Solve part B of the day using the backward search.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part B.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        return sum(
+            test_value
+            for test_value, remaining_numbers in input_list
+            if can_form_target_backward(
+                list(remaining_numbers), test_value, allow_concat=True
+            )
+        )
+
+
+def solve_part_a_iterative(filename: str) -> int:
+    """Solve part A of the day using the iterative search.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part A.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        return sum(
+            test_value
+            for test_value, remaining_numbers in input_list
+            if can_form_target_iterative(list(remaining_numbers), test_value)
+        )
+
+
+def solve_part_b_iterative(filename: str) -> int:
+    """Solve part B of the day using the iterative search.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part B.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        return sum(
+            test_value
+            for test_value, remaining_numbers in input_list
+            if can_form_target_iterative(
+                list(remaining_numbers), test_value, allow_concat=True
+            )
+        )
+
+
+def solve_part_a_batch(filename: str) -> int:
+    """Solve part A of the day by checking all equations in one batch.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part A.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        solved = can_form_targets_batch(input_list)
+    with stage("reduce"):
+        return sum(
+            test_value
+            for (test_value, _), is_solved in zip(input_list, solved)
+            if is_solved
+        )
+
+
+def solve_part_b_batch(filename: str) -> int:
+    """Solve part B of the day by checking all equations in one batch.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part B.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        solved = can_form_targets_batch(input_list, allow_concat=True)
+    with stage("reduce"):
+        return sum(
+            test_value
+            for (test_value, _), is_solved in zip(input_list, solved)
+            if is_solved
+        )
+
+
+# The largest search tree depth counted when estimating the cost of an equation
+MAX_COST_EXPONENT = 60
+
+
+def _calibrate_chunk(
+    chunk: list[tuple[int, tuple[int, ...]]], allow_concat: bool
+) -> int:
+    """Sum the test values of the equations in a chunk that can be formed.
+
+    Parameters
+    ----------
+    chunk : list[tuple[int, tuple[int, ...]]]
+        The equations to check.
+    allow_concat : bool
+        Whether concatenation may be used as well.
+
+    Returns
+    -------
+    int
+        The partial calibration result of the chunk.
+
+    """
+    return sum(
+        test_value
+        for test_value, remaining_numbers in chunk
+        if can_form_target_iterative(list(remaining_numbers), test_value, allow_concat)
+    )
+
+
+def solve_parallel(
+    filename: str,
+    allow_concat: bool = False,
+    max_workers: int | None = None,
+    chunks_per_worker: int = 8,
+) -> int:
+    """Compute the calibration result on a pool of processes.
+
+    The cost of an equation is estimated from its number of operands as the size of
+    its search tree. Equations are sent longest first, in chunks holding roughly an
+    equal share of the total cost, so a long equation travels alone while short ones
+    are batched. Idle workers take the next chunk from the shared queue, so no single
+    straggler is left for the end.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+    allow_concat : bool, optional
+        Whether concatenation may be used as well, by default False.
+    max_workers : int, optional
+        The number of processes, by default the number of CPUs.
+    chunks_per_worker : int, optional
+        Roughly how many chunks each worker gets, by default 8.
+
+    Returns
+    -------
+    int
+        The total calibration result.
+
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with stage("parse"):
+        input_list = parse_file(filename)
+    branching = 3 if allow_concat else 2
+    # Capped floats, as exact tree sizes of long equations overflow a float division,
+    # and an equation this long fills a chunk on its own anyway.
+    costs = [
+        float(branching) ** min(len(nums) - 1, MAX_COST_EXPONENT)
+        for _, nums in input_list
+    ]
+    order = sorted(range(len(input_list)), key=costs.__getitem__, reverse=True)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    budget = sum(costs) / (max_workers * chunks_per_worker)
+
+    with stage("search"):
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            chunk: list[tuple[int, tuple[int, ...]]] = []
+            chunk_cost = 0.0
+            for i in order:
+                chunk.append(input_list[i])
+                chunk_cost += costs[i]
+                if chunk_cost >= budget:
+                    futures.append(
+                        executor.submit(_calibrate_chunk, chunk, allow_concat)
+                    )
+                    chunk, chunk_cost = [], 0
+            if chunk:
+                futures.append(executor.submit(_calibrate_chunk, chunk, allow_concat))
+            return sum(future.result() for future in futures)
+
+
+def solve_part_a_parallel(filename: str) -> int:
+    """Solve part A of the day on a pool of processes.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part A.
+
+    """
+    return solve_parallel(filename)
+
+
+def solve_part_b_parallel(filename: str) -> int:
+    """Solve part B of the day on a pool of processes.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part B.
+
+    """
+    return solve_parallel(filename, allow_concat=True)
+
+
+def solve_part_a_trie(filename: str) -> int:
+    """Solve part A of the day, sharing work between common prefixes.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part A.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        solved = solve_with_prefix_trie(input_list)
+    with stage("reduce"):
+        return sum(
+            test_value
+            for (test_value, _), is_solved in zip(input_list, solved)
+            if is_solved
+        )
+
+
+def solve_part_b_trie(filename: str) -> int:
+    """Solve part B of the day, sharing work between common prefixes.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    int
+        The solution to part B.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    with stage("search"):
+        solved = solve_with_prefix_trie(input_list, ("+", "*", "||"))
+    with stage("reduce"):
+        return sum(
+            test_value
+            for (test_value, _), is_solved in zip(input_list, solved)
+            if is_solved
+        )
+
+
+def solve_both_parts(filename: str) -> tuple[int, int]:
+    """Solve both parts of the day with one parse and one search per equation.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file to parse.
+
+    Returns
+    -------
+    tuple[int, int]
+        The solutions to part A and part B.
+
+    """
+    with stage("parse"):
+        input_list = parse_file(filename)
+    part_a_result = 0
+    concat_only_result = 0
+    with stage("search"):
+        for test_value, remaining_numbers in input_list:
+            equation_class = classify_equation(list(remaining_numbers), test_value)
+            if equation_class == SOLVABLE_WITHOUT_CONCAT:
+                part_a_result += test_value
+            elif equation_class == SOLVABLE_ONLY_WITH_CONCAT:
+                concat_only_result += test_value
+    return part_a_result, part_a_result + concat_only_result
+
+
 if __name__ == "__main__":
     result = solve_part_b(filename="input.txt")
     print(str(result))
@@ -1,6 +1,33 @@
 import pytest
 
-from .sol import solve_part_a, solve_part_b
+from .sol import (
+    OPERATORS,
+    SOLVABLE_ONLY_WITH_CONCAT,
+    SOLVABLE_WITHOUT_CONCAT,
+    UNSOLVABLE,
+    can_form_target,
+    can_form_target_backward,
+    can_form_target_iterative,
+    can_form_target_with_concat,
+    can_form_target_with_operators,
+    can_form_targets_batch,
+    classify_equation,
+    parse_file,
+    register_operator,
+    solve_both_parts,
+    solve_part_a,
+    solve_part_a_backward,
+    solve_part_a_batch,
+    solve_part_a_iterative,
+    solve_part_a_trie,
+    solve_part_b,
+    solve_part_b_backward,
+    solve_part_b_batch,
+    solve_part_b_iterative,
+    solve_part_b_trie,
+    solve_parallel,
+    solve_with_prefix_trie,
+)
 
 
 def test_solve_part_a():
@@ -11,3 +38,149 @@ def test_solve_part_a():
 def test_solve_part_b():
     expected_output = 11387
     assert solve_part_b("test_input.txt") == expected_output
+
+
+def test_solve_part_a_backward():
+    expected_output = 3749
+    assert solve_part_a_backward("test_input.txt") == expected_output
+
+
+def test_solve_part_b_backward():
+    expected_output = 11387
+    assert solve_part_b_backward("test_input.txt") == expected_output
+
+
+@pytest.mark.parametrize(
+    "nums, target",
+    [
+        ([0, 5], 5),
+        ([0, 5], 0),
+        ([3, 0], 0),
+        ([2, 0, 4], 24),
+        ([1, 1], 11),
+        ([10, 1], 11),
+        ([7], 7),
+        ([6, 8, 6, 15], 7290),
+    ],
+)
+def test_can_form_target_backward_edge_cases(nums, target):
+    assert can_form_target_backward(nums, target) == can_form_target(nums, target)
+    assert can_form_target_backward(
+        nums, target, allow_concat=True
+    ) == can_form_target_with_concat(nums, target)
+
+
+def test_solve_part_a_iterative():
+    expected_output = 3749
+    assert solve_part_a_iterative("test_input.txt") == expected_output
+
+
+def test_solve_part_b_iterative():
+    expected_output = 11387
+    assert solve_part_b_iterative("test_input.txt") == expected_output
+
+
+def test_can_form_target_iterative_hundreds_of_numbers():
+    nums = [(i % 97) + 2 for i in range(500)]
+    assert can_form_target_iterative(nums, sum(nums), allow_concat=True)
+    assert not can_form_target_iterative(nums, sum(nums) - 1, allow_concat=True)
+
+
+@pytest.mark.parametrize("allow_concat", [False, True])
+def test_can_form_target_iterative_repeated_values(allow_concat):
+    # Every operator combination reaches one of few values, and none reaches 1024.
+    assert not can_form_target_iterative([2] * 700, 1024, allow_concat)
+    assert can_form_target_iterative([2] * 10, 1024, allow_concat)
+
+
+def test_solve_both_parts():
+    assert solve_both_parts("test_input.txt") == (3749, 11387)
+
+
+@pytest.mark.parametrize(
+    "nums, target, expected_class",
+    [
+        ([10, 19], 190, SOLVABLE_WITHOUT_CONCAT),
+        ([15, 6], 156, SOLVABLE_ONLY_WITH_CONCAT),
+        ([17, 5], 83, UNSOLVABLE),
+        ([6, 8, 6, 15], 7290, SOLVABLE_ONLY_WITH_CONCAT),
+        ([3, 0], 0, SOLVABLE_WITHOUT_CONCAT),
+        # Operator combinations reach few distinct values, all of them even.
+        ([2] * 700, 1023, UNSOLVABLE),
+        ([2] * 10, 1024, SOLVABLE_WITHOUT_CONCAT),
+        ([2] * 10, 2222, SOLVABLE_ONLY_WITH_CONCAT),
+    ],
+)
+def test_classify_equation(nums, target, expected_class):
+    assert classify_equation(nums, target) == expected_class
+
+
+def test_solve_part_a_batch():
+    expected_output = 3749
+    assert solve_part_a_batch("test_input.txt") == expected_output
+
+
+def test_solve_part_b_batch():
+    expected_output = 11387
+    assert solve_part_b_batch("test_input.txt") == expected_output
+
+
+def test_can_form_targets_batch_falls_back_for_large_and_zero_rows():
+    equations = [
+        (10**30 + 7, (10**15, 10**15, 7)),
+        (10**30 + 8, (10**15, 10**15, 7)),
+        (0, (3, 0)),
+        (190, (10, 19)),
+    ]
+    assert can_form_targets_batch(equations).tolist() == [True, False, True, True]
+
+
+@pytest.mark.parametrize(
+    "allow_concat, expected_output", [(False, 3749), (True, 11387)]
+)
+def test_solve_parallel(allow_concat, expected_output):
+    assert (
+        solve_parallel("test_input.txt", allow_concat=allow_concat, max_workers=2)
+        == expected_output
+    )
+
+
+def test_solve_part_a_trie():
+    expected_output = 3749
+    assert solve_part_a_trie("test_input.txt") == expected_output
+
+
+def test_solve_part_b_trie():
+    expected_output = 11387
+    assert solve_part_b_trie("test_input.txt") == expected_output
+
+
+def test_solve_with_prefix_trie_shared_prefixes():
+    equations = [(30, (2, 3, 5)), (11, (2, 3, 5)), (12, (2, 3, 6)), (6, (2, 3))]
+    assert solve_with_prefix_trie(equations) == [True, True, True, True]
+    assert solve_with_prefix_trie([(7, (2, 3, 5)), (0, (2, 0))]) == [False, True]
+
+
+def test_register_operator():
+    register_operator("-", lambda left, right: left - right)
+    try:
+        assert can_form_target_with_operators([10, 3, 2], 5, ("-",))
+        assert can_form_target_with_operators([10, 3, 2], 14, ("-", "*"))
+        assert solve_with_prefix_trie([(5, (10, 3, 2))], ("-",)) == [True]
+    finally:
+        OPERATORS.pop("-")
+
+
+@pytest.mark.parametrize("allow_concat", [False, True])
+def test_solve_parallel_long_equation(tmp_path, allow_concat):
+    # Far more operands than an exact search tree size fits in a float
+    nums = [1] * 1100
+    filename = tmp_path / "input.txt"
+    filename.write_text(f"{len(nums)}: {' '.join(map(str, nums))}\n190: 10 19\n")
+    assert solve_parallel(str(filename), allow_concat, max_workers=2) == 1290
+
+
+@pytest.mark.parametrize("content", [b"190 10 19\n", b"190: 10: 19\n", b": 10 19\n"])
+def test_parse_file_rejects_lines_without_one_colon(content):
+    with pytest.raises(ValueError):
+        parse_file(content)
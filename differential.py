@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+import argparse
+import itertools
+import random
+import sys
+from collections.abc import Callable, Iterator
+from typing import Any, NamedTuple
+
+from .day02 import sol as day02
+from .day05 import sol as day05
+from .day06 import sol as day06
+from .day07 import sol as day07
+
+
+class EnginePair(NamedTuple):
+    """An optimized engine and the reference implementation it must agree with.
+
+    Attributes
+    ----------
+    name : str
+        A unique name for the pair.
+    generate : Callable[[random.Random], tuple]
+        Returns random arguments accepted by both functions.
+    reference : Callable[..., Any]
+        The reference implementation.
+    candidate : Callable[..., Any]
+        The optimized engine.
+    is_valid : Callable[..., bool] | None
+        Returns whether shrunk arguments are still a valid input, by default any
+        arguments the reference accepts are.
+
+    """
+
+    name: str
+    generate: Callable[[random.Random], tuple]
+    reference: Callable[..., Any]
+    candidate: Callable[..., Any]
+    is_valid: Callable[..., bool] | None = None
+
+
+class Mismatch(NamedTuple):
+    """Arguments on which an engine disagrees with its reference."""
+
+    name: str
+    args: tuple
+    expected: Any
+    actual: Any
+
+
+ENGINE_PAIRS: dict[str, EnginePair] = {}
+
+
+def register_engine(
+    name: str,
+    generate: Callable[[random.Random], tuple],
+    reference: Callable[..., Any],
+    candidate: Callable[..., Any],
+    is_valid: Callable[..., bool] | None = None,
+) -> None:
+    """Register an optimized engine to be checked against its reference.
+
+    Parameters
+    ----------
+    name : str
+        A unique name for the pair.
+    generate : Callable[[random.Random], tuple]
+        Returns random arguments accepted by both functions.
+    reference : Callable[..., Any]
+        The reference implementation.
+    candidate : Callable[..., Any]
+        The optimized engine.
+    is_valid : Callable[..., bool], optional
+        Returns whether shrunk arguments are still a valid input, by default None.
+
+    """
+    ENGINE_PAIRS[name] = EnginePair(name, generate, reference, candidate, is_valid)
+
+
+def _outcome(function: Callable[..., Any], args: tuple) -> Any:
+    """Call a function, turning an exception into a comparable value."""
+    try:
+        return function(*args)
+    except Exception as error:
+        return f"raised {type(error).__name__}"
+
+
+def _disagree(pair: EnginePair, args: tuple) -> tuple[Any, Any] | None:
+    """Return both outcomes if the pair disagrees on valid arguments."""
+    if pair.is_valid is not None and not pair.is_valid(*args):
+        return None
+    expected = _outcome(pair.reference, args)
+    if isinstance(expected, str) and expected.startswith("raised "):
+        # Arguments the reference rejects are not a valid input.
+        return None
+    actual = _outcome(pair.candidate, args)
+    if actual == expected:
+        return None
+    return expected, actual
+
+
+def _smaller_values(value: Any) -> Iterator[Any]:
+    """Yield values that are one step simpler than the given one."""
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        for smaller in (0, value // 2, value - 1 if value > 0 else value + 1):
+            if abs(smaller) < abs(value):
+                yield smaller
+    elif isinstance(value, (list, tuple)):
+        for i in range(len(value)):
+            yield type(value)(value[:i] + value[i + 1 :])
+        for i, item in enumerate(value):
+            for smaller in _smaller_values(item):
+                yield type(value)(value[:i] + type(value)([smaller]) + value[i + 1 :])
+
+
+def shrink(pair: EnginePair, args: tuple) -> tuple:
+    """Shrink arguments on which a pair disagrees to a minimal disagreeing case.
+
+    Elements are removed from lists and numbers moved towards zero, one step at a
+    time, for as long as the pair still disagrees.
+
+    Parameters
+    ----------
+    pair : EnginePair
+        The engine pair.
+    args : tuple
+        Arguments on which the pair disagrees.
+
+    Returns
+    -------
+    tuple
+        Arguments on which the pair still disagrees and that cannot be simplified
+        further.
+
+    """
+    while True:
+        candidates = (
+            args[:i] + (smaller,) + args[i + 1 :]
+            for i, arg in enumerate(args)
+            for smaller in _smaller_values(arg)
+        )
+        for smaller in candidates:
+            if _disagree(pair, smaller) is not None:
+                args = smaller
+                break
+        else:
+            return args
+
+
+def check_engine(pair: EnginePair, trials: int = 200, seed: int = 0) -> Mismatch | None:
+    """Compare an engine with its reference on random inputs.
+
+    Parameters
+    ----------
+    pair : EnginePair
+        The engine pair.
+    trials : int, optional
+        The number of random inputs, by default 200.
+    seed : int, optional
+        The random seed, by default 0.
+
+    Returns
+    -------
+    Mismatch | None
+        The shrunk disagreeing case, or None if the engine agreed on every input.
+
+    """
+    rng = random.Random(seed)
+    for _ in range(trials):
+        args = pair.generate(rng)
+        if _disagree(pair, args) is not None:
+            args = shrink(pair, args)
+            expected, actual = _disagree(pair, args)
+            return Mismatch(pair.name, args, expected, actual)
+    return None
+
+
+def _random_report(rng: random.Random) -> tuple:
+    # Mostly steps of one direction, with a few bad ones, to cover every tolerance.
+    sign = rng.choice((-1, 1))
+    row = [rng.randint(0, 20)]
+    for _ in range(rng.randint(0, 7)):
+        step = sign * rng.randint(1, 3) if rng.random() < 0.8 else rng.randint(-5, 5)
+        row.append(row[-1] + step)
+    return (row,)
+
+
+def _random_report_and_tolerance(rng: random.Random) -> tuple:
+    return _random_report(rng) + (rng.randint(0, 3),)
+
+
+def _safe_after_removing(row: list[int], k: int) -> bool:
+    # Every way of removing at most k levels
+    return any(
+        day02.is_safe(list(kept))
+        for size in range(max(len(row) - k, 0), len(row) + 1)
+        for kept in itertools.combinations(row, size)
+    )
+
+
+def _random_rules_and_updates(rng: random.Random) -> tuple:
+    pages = rng.sample(range(1, 30), rng.randint(2, 10))
+    rules = [tuple(rng.sample(pages, 2)) for _ in range(rng.randint(0, 15))]
+    updates = [
+        rng.sample(pages, rng.randint(1, len(pages))) for _ in range(rng.randint(1, 8))
+    ]
+    return updates, rules
+
+
+def _distinct_pages(updates: list[list[int]], rules: list) -> bool:
+    return all(
+        update and len(set(update)) == len(update) for update in updates
+    ) and all(len(rule) == 2 for rule in rules)
+
+
+def _random_ordered_rules_and_updates(rng: random.Random) -> tuple:
+    # Rules between every pair of pages, so that each update has one correct order.
+    order = rng.sample(range(1, 30), rng.randint(1, 10))
+    rules = [
+        (order[i], order[j])
+        for i in range(len(order))
+        for j in range(i + 1, len(order))
+    ]
+    rng.shuffle(rules)
+    updates = [
+        rng.sample(order, rng.randint(1, len(order))) for _ in range(rng.randint(1, 8))
+    ]
+    return updates, rules
+
+
+def _totally_ordered(updates: list[list[int]], rules: list) -> bool:
+    if (
+        not _distinct_pages(updates, rules)
+        or min((page for rule in rules for page in rule), default=0) < 0
+    ):
+        return False
+    rule_set = set(rules)
+    for update in updates:
+        pairs = [(x, y) for x in update for y in update if (x, y) in rule_set]
+        if any(x == y or (y, x) in rule_set for x, y in pairs):
+            return False
+        # Without opposite rules, distinct numbers of predecessors mean that the
+        # rules order every pair of pages.
+        predecessors = [sum(y == page for _, y in pairs) for page in update]
+        if sorted(predecessors) != list(range(len(update))):
+            return False
+    return True
+
+
+def _random_guard_map(rng: random.Random) -> tuple:
+    height, width = rng.randint(1, 8), rng.randint(1, 8)
+    grid = [
+        ["#" if rng.random() < 0.2 else "." for _ in range(width)]
+        for _ in range(height)
+    ]
+    if rng.random() < 0.5:
+        # Walled maps, as few guards walk in a loop on open ones.
+        for i, row in enumerate(grid):
+            for j in range(width):
+                if i in (0, height - 1) or j in (0, width - 1):
+                    row[j] = "#"
+    i, j = rng.randrange(height), rng.randrange(width)
+    grid[i][j] = rng.choice("^>v<")
+    # Mostly in line with the guard, where obstacles change the walk more often.
+    obstacles = [
+        rng.choice(
+            (
+                (i, rng.randrange(width)),
+                (rng.randrange(height), j),
+                (rng.randrange(height), rng.randrange(width)),
+            )
+        )
+        for _ in range(rng.randint(0, 3))
+    ]
+    return ["".join(row) for row in grid], obstacles
+
+
+def _one_guard_inside(rows: list[str], obstacles: list) -> bool:
+    return (
+        len(rows) > 0
+        and len({len(row) for row in rows}) == 1
+        and len(rows[0]) > 0
+        and sum(row.count(symbol) for row in rows for symbol in "^>v<") == 1
+        and all(
+            len(obstacle) == 2
+            and 0 <= obstacle[0] < len(rows)
+            and 0 <= obstacle[1] < len(rows[0])
+            for obstacle in obstacles
+        )
+    )
+
+
+def _trapped_by_walking(rows: list[str], obstacles: list) -> bool:
+    grid = [list(row) for row in rows]
+    location, direction = day06.find_start_location_and_direction(grid)
+    for obstacle in obstacles:
+        day06.mark_location_as_obstacle(obstacle, grid)
+    # One step or one turn at a time, until the guard leaves or repeats a state.
+    seen = set()
+    while (location, direction) not in seen:
+        seen.add((location, direction))
+        next_location = day06.find_next_location(location, direction)
+        if not day06.is_in_grid(next_location, grid):
+            return False
+        if day06.is_obstacle(next_location, grid):
+            direction = day06.rotate_right(direction)
+        else:
+            location = next_location
+    return True
+
+
+def _random_equation(rng: random.Random) -> tuple:
+    nums = [rng.randint(0, 20) for _ in range(rng.randint(1, 6))]
+    # Half of the targets are formed with random operators so that many are solvable.
+    target = nums[0]
+    for num in nums[1:]:
+        target = rng.choice(
+            (target + num, target * num, int(f"{target}{num}"), target + 1)
+        )
+    if rng.random() < 0.5:
+        target = rng.randint(0, 2 * target + 10)
+    return nums, target
+
+
+def _non_empty_nums(nums: list[int], target: int) -> bool:
+    return len(nums) > 0 and min(nums) >= 0 and target >= 0
+
+
+def _classify_with_reference(nums: list[int], target: int) -> int:
+    if day07.can_form_target(nums, target):
+        return day07.SOLVABLE_WITHOUT_CONCAT
+    if day07.can_form_target_with_concat(nums, target):
+        return day07.SOLVABLE_ONLY_WITH_CONCAT
+    return day07.UNSOLVABLE
+
+
+register_engine(
+    "day02.is_safe_with_removals_k0",
+    _random_report,
+    day02.is_safe,
+    lambda row: day02.is_safe_with_removals(row, 0),
+)
+register_engine(
+    "day02.is_safe_with_removals_k1",
+    _random_report,
+    lambda row: day02.is_safe(row, allow_dampened=True),
+    lambda row: day02.is_safe_with_removals(row, 1),
+)
+register_engine(
+    "day02.is_safe_with_removals",
+    _random_report_and_tolerance,
+    _safe_after_removing,
+    day02.is_safe_with_removals,
+)
+register_engine(
+    "day05.validate_updates_batch",
+    _random_rules_and_updates,
+    lambda updates, rules: [day05.update_is_valid(u, rules) for u in updates],
+    lambda updates, rules: day05.validate_updates_batch(updates, rules)[0].tolist(),
+    _distinct_pages,
+)
+register_engine(
+    "day05.check_update",
+    _random_rules_and_updates,
+    lambda updates, rules: [day05.update_is_valid(u, rules) for u in updates],
+    lambda updates, rules: [
+        day05.check_update(
+            day05.build_rule_matrix(
+                rules, max((max(rule) for rule in rules), default=0) + 2
+            ),
+            update,
+        )[0]
+        for update in updates
+    ],
+    _distinct_pages,
+)
+
+
+register_engine(
+    "day05.select_middle_page",
+    _random_ordered_rules_and_updates,
+    lambda updates, rules: [
+        day05.reorder_update(update, rules)[len(update) // 2] for update in updates
+    ],
+    lambda updates, rules: [
+        day05.select_middle_page(update, day05.build_predecessor_masks(rules))
+        for update in updates
+    ],
+    _totally_ordered,
+)
+register_engine(
+    "day06.ObstacleQueryEngine",
+    _random_guard_map,
+    _trapped_by_walking,
+    lambda rows, obstacles: day06.ObstacleQueryEngine(
+        [list(row) for row in rows]
+    ).is_trapped(obstacles),
+    _one_guard_inside,
+)
+
+
+def _register_day07_engines(concat: bool) -> None:
+    reference = day07.can_form_target_with_concat if concat else day07.can_form_target
+    operators = ("+", "*", "||") if concat else ("+", "*")
+    suffix = "_with_concat" if concat else ""
+
+    register_engine(
+        f"day07.can_form_target_backward{suffix}",
+        _random_equation,
+        reference,
+        lambda nums, target: day07.can_form_target_backward(nums, target, concat),
+        _non_empty_nums,
+    )
+    register_engine(
+        f"day07.can_form_target_iterative{suffix}",
+        _random_equation,
+        reference,
+        lambda nums, target: day07.can_form_target_iterative(nums, target, concat),
+        _non_empty_nums,
+    )
+    register_engine(
+        f"day07.can_form_targets_batch{suffix}",
+        _random_equation,
+        reference,
+        lambda nums, target: bool(
+            day07.can_form_targets_batch([(target, tuple(nums))], concat)[0]
+        ),
+        _non_empty_nums,
+    )
+    register_engine(
+        f"day07.can_form_target_with_operators{suffix}",
+        _random_equation,
+        reference,
+        lambda nums, target: day07.can_form_target_with_operators(
+            nums, target, operators
+        ),
+        _non_empty_nums,
+    )
+    register_engine(
+        f"day07.solve_with_prefix_trie{suffix}",
+        _random_equation,
+        reference,
+        lambda nums, target: day07.solve_with_prefix_trie(
+            [(target, tuple(nums))], operators
+        )[0],
+        _non_empty_nums,
+    )
+
+
+_register_day07_engines(concat=False)
+_register_day07_engines(concat=True)
+register_engine(
+    "day07.classify_equation",
+    _random_equation,
+    _classify_with_reference,
+    day07.classify_equation,
+    _non_empty_nums,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Check every registered engine from the command line.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {__package__}.differential")
+    parser.add_argument("--trials", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("engines", nargs="*", help="defaults to every engine")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name in args.engines or ENGINE_PAIRS:
+        mismatch = check_engine(ENGINE_PAIRS[name], args.trials, args.seed)
+        if mismatch is None:
+            print(f"{name}: ok")
+        else:
+            failed = True
+            print(
+                f"{name}: {mismatch.args} gives {mismatch.actual}, "
+                f"expected {mismatch.expected}"
+            )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import random
+import sys
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+# Sizes giving inputs roughly as large as the puzzle inputs
+PUZZLE_SIZES = {1: 1000, 2: 1000, 3: 700, 4: 784, 5: 200, 6: 30, 7: 850}
+
+
+def generate_day01(size: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """Generate `size` pairs of location IDs.
+
+    Parameters
+    ----------
+    size : int
+        The number of pairs.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers to part A and part B.
+
+    """
+    # A narrow range makes sure that many IDs appear in both lists.
+    left = [rng.randint(10000, 10000 + size) for _ in range(size)]
+    right = [rng.randint(10000, 10000 + size) for _ in range(size)]
+    content = "".join(f"{x}   {y}\n" for x, y in zip(left, right))
+
+    right_counts = Counter(right)
+    answers = {
+        "a": sum(abs(x - y) for x, y in zip(sorted(left), sorted(right))),
+        "b": sum(x * right_counts[x] for x in left),
+    }
+    return content, answers
+
+
+def _safe_report(length: int, rng: random.Random) -> list[int]:
+    """Return a report whose levels all increase or all decrease by 1 to 3."""
+    step_sign = rng.choice((-1, 1))
+    report = [rng.randint(30, 60)]
+    for _ in range(length - 1):
+        report.append(report[-1] + step_sign * rng.randint(1, 3))
+    return report
+
+
+def generate_day02(size: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """Generate `size` reports, each safe, safe after one removal or unsafe.
+
+    Reports safe after one removal are safe reports with a copy of a level inserted
+    next to it. Unsafe reports get two such copies far enough apart that no single
+    removal fixes both.
+
+    Parameters
+    ----------
+    size : int
+        The number of reports.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers to part A and part B.
+
+    """
+    lines = []
+    answers = {"a": 0, "b": 0}
+    for _ in range(size):
+        kind = rng.randrange(3)
+        report = _safe_report(rng.randint(5, 8), rng)
+        if kind == 0:
+            answers["a"] += 1
+            answers["b"] += 1
+        elif kind == 1:
+            i = rng.randrange(len(report))
+            report.insert(i, report[i])
+            answers["b"] += 1
+        else:
+            # Zero differences between positions 1-2 and at least 4-5.
+            j = rng.randrange(3, len(report))
+            report.insert(j, report[j])
+            report.insert(1, report[1])
+        lines.append(" ".join(map(str, report)))
+    return "\n".join(lines) + "\n", answers
+
+
+# Fragments that contain no valid instruction, even next to any other fragment
+_DAY03_NOISE = (
+    "mul(4*",
+    "mul[3,7]",
+    "mul ( 2 , 4 )",
+    "?mul(12,34",
+    "+mul(1000,2)",
+    "mul(6,9!",
+    "select(",
+    "from()",
+    "what()",
+    "don_t()",
+    "#",
+    "%&",
+    "]then",
+)
+
+
+def generate_day03(size: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """Generate corrupted memory holding `size` valid multiplications.
+
+    Parameters
+    ----------
+    size : int
+        The number of valid `mul(x,y)` instructions.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers to part A and part B.
+
+    """
+    fragments = []
+    answers = {"a": 0, "b": 0}
+    enabled = True
+    for i in range(size):
+        fragments.extend(rng.choices(_DAY03_NOISE, k=rng.randint(0, 3)))
+        if rng.random() < 0.1:
+            enabled = rng.random() < 0.5
+            fragments.append("do()" if enabled else "don't()")
+        x, y = rng.randint(1, 999), rng.randint(1, 999)
+        fragments.append(f"mul({x},{y})")
+        answers["a"] += x * y
+        if enabled:
+            answers["b"] += x * y
+        if i % 100 == 99:
+            fragments.append("\n")
+    return "".join(fragments) + "\n", answers
+
+
+_DAY04_FILLER = "BCDEFGHIJKLNOPQRTUVWYZ"
+_DAY04_DIRECTIONS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
+
+def generate_day04(size: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """Generate a letter grid of about `size` 5x5 cells, some holding a planted word.
+
+    Each cell holds nothing, one `XMAS` in a random direction or one X-shaped `MAS`
+    pair. Cells are separated by filler letters, which never include X, M, A or S,
+    so no word can be formed across cells.
+
+    Parameters
+    ----------
+    size : int
+        The number of cells.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers to part A and part B.
+
+    """
+    cells_across = max(1, round(size**0.5))
+    cells_down = max(1, -(-size // cells_across))
+    grid = [
+        [rng.choice(_DAY04_FILLER) for _ in range(cells_across * 5)]
+        for _ in range(cells_down * 5)
+    ]
+
+    answers = {"a": 0, "b": 0}
+    for cell_row in range(cells_down):
+        for cell_col in range(cells_across):
+            top, left = cell_row * 5, cell_col * 5
+            kind = rng.randrange(3)
+            if kind == 1:
+                dx, dy = rng.choice(_DAY04_DIRECTIONS)
+                x = top + (3 if dx < 0 else 0 if dx > 0 else rng.randrange(4))
+                y = left + (3 if dy < 0 else 0 if dy > 0 else rng.randrange(4))
+                for k, letter in enumerate("XMAS"):
+                    grid[x + dx * k][y + dy * k] = letter
+                answers["a"] += 1
+            elif kind == 2:
+                first, second = rng.choice("MS"), rng.choice("MS")
+                grid[top + 1][left + 1] = "A"
+                grid[top][left] = first
+                grid[top + 2][left + 2] = "S" if first == "M" else "M"
+                grid[top][left + 2] = second
+                grid[top + 2][left] = "S" if second == "M" else "M"
+                answers["b"] += 1
+    return "".join("".join(row) + "\n" for row in grid), answers
+
+
+def generate_day05(size: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """Generate rules ordering 49 pages completely, and `size` updates.
+
+    Parameters
+    ----------
+    size : int
+        The number of updates.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers to part A and part B.
+
+    """
+    pages = rng.sample(range(10, 100), 49)
+    rank = {page: i for i, page in enumerate(pages)}
+    rules = [(x, y) for i, x in enumerate(pages) for y in pages[i + 1 :]]
+    rng.shuffle(rules)
+
+    lines = []
+    answers = {"a": 0, "b": 0}
+    for _ in range(size):
+        update = sorted(rng.sample(pages, rng.randrange(5, 24, 2)), key=rank.get)
+        middle_page = update[len(update) // 2]
+        if rng.random() < 0.5:
+            answers["a"] += middle_page
+        else:
+            correct_order = list(update)
+            while update == correct_order:
+                rng.shuffle(update)
+            answers["b"] += middle_page
+        lines.append(",".join(map(str, update)))
+
+    content = "".join(f"{x}|{y}\n" for x, y in rules) + "\n" + "\n".join(lines) + "\n"
+    return content, answers
+
+
+def generate_day06(size: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """Generate a guard map where exactly `size` new obstacles cause a loop.
+
+    The guard walks straight up column 1 and out of the map. Above it, each of
+    `size` horizontal bands holds three obstacles that, together with a new obstacle
+    placed on the guard's column just above the band, enclose a rectangular loop.
+    Every other new obstacle on the guard's path sends the guard out of the map.
+
+    Parameters
+    ----------
+    size : int
+        The number of loops to plant.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers to part A and part B.
+
+    """
+    column = 1
+    obstacles = []
+    band_top = 1
+    for k in range(size):
+        # The loop turns right below `band_top`, down at `right` and left at `bottom`.
+        right = column + 2 + 3 * k
+        height = rng.randint(2, 4)
+        obstacles.append((band_top + 1, right))
+        obstacles.append((band_top + 1 + height, right - 1))
+        obstacles.append((band_top + height, column - 1))
+        band_top += height + 2 + rng.randint(0, 2)
+
+    start_row = band_top + rng.randint(1, 5)
+    rows = start_row + 1 + rng.randint(0, 5)
+    cols = column + 3 * size + 3
+    grid = [["."] * cols for _ in range(rows)]
+    for i, j in obstacles:
+        grid[i][j] = "#"
+    grid[start_row][column] = "^"
+
+    answers = {"a": start_row + 1, "b": size}
+    return "".join("".join(row) + "\n" for row in grid), answers
+
+
+def generate_day07(size: int, rng: random.Random) -> tuple[str, dict[str, int]]:
+    """Generate `size` calibration equations with numbers of at least two.
+
+    Numbers of at least two make multiplying everything the largest value reachable
+    with addition and multiplication, and concatenating everything the largest value
+    reachable with all three operators. Equations needing concatenation are built to
+    exceed the former, and unsolvable ones to exceed the latter.
+
+    Parameters
+    ----------
+    size : int
+        The number of equations.
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers to part A and part B.
+
+    """
+    lines = []
+    answers = {"a": 0, "b": 0}
+    for _ in range(size):
+        kind = rng.randrange(3)
+        while True:
+            nums = [rng.randint(2, 999) for _ in range(rng.randint(2, 9))]
+            operators = rng.choices("+*|" if kind == 1 else "+*", k=len(nums) - 1)
+            if kind == 1 and "|" not in operators:
+                continue
+            value = nums[0]
+            for operator, num in zip(operators, nums[1:]):
+                if operator == "+":
+                    value += num
+                elif operator == "*":
+                    value *= num
+                else:
+                    value = int(f"{value}{num}")
+
+            if kind == 0:
+                answers["a"] += value
+                answers["b"] += value
+                break
+            if kind == 1:
+                product = 1
+                for num in nums:
+                    product *= num
+                if value > product:
+                    answers["b"] += value
+                    break
+                continue
+            value = int("".join(map(str, nums))) + rng.randint(1, 1000)
+            break
+        lines.append(f"{value}: {' '.join(map(str, nums))}")
+    return "\n".join(lines) + "\n", answers
+
+
+GENERATORS: dict[int, Callable[[int, random.Random], tuple[str, dict[str, int]]]] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> tuple[str, dict[str, int]]:
+    """Generate an input for a day together with its answers.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+    size : int
+        The size of the input, in the day's own unit (see each generator).
+    seed : int, optional
+        The random seed, by default 0.
+
+    Returns
+    -------
+    tuple[str, dict[str, int]]
+        The input and the answers, keyed by part.
+
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Generate an input from the command line.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {__package__}.generators")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("scale", type=float, help="multiple of the puzzle input size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the input here instead of stdout")
+    parser.add_argument("--answers", help="write the expected answers to this file")
+    args = parser.parse_args(argv)
+
+    size = max(1, round(PUZZLE_SIZES[args.day] * args.scale))
+    content, answers = generate(args.day, size, args.seed)
+    if args.output is None:
+        sys.stdout.write(content)
+    else:
+        Path(args.output).write_text(content)
+    if args.answers is not None:
+        with Path(args.answers).open("w") as file:
+            json.dump(answers, file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+import warnings
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Inputs up to this size are parsed in pure Python, here and by the solutions, which
+# takes less time than importing NumPy
+SMALL_INPUT_BYTES = 64 * 1024
+
+DEFAULT_SEPARATORS = b" \t\r"
+
+
+def _check_bytes(data: bytes, delimiters: bytes) -> None:
+    """Raise if the buffer holds a byte that is neither a digit, a minus sign nor a
+    delimiter."""
+    unexpected = data.translate(None, b"0123456789-" + delimiters)
+    if unexpected:
+        position = data.index(unexpected[:1])
+        raise ValueError(f"Unexpected byte {unexpected[:1]!r} at {position}")
+
+
+def _parse_tokens(spaced: bytes) -> "np.ndarray":
+    """Parse integers separated by spaces with NumPy's C parser."""
+    import numpy as np
+
+    with warnings.catch_warnings():
+        # Older NumPy versions warn instead of raising on a misplaced minus sign.
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(spaced, dtype=np.int64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            raise ValueError("A minus sign must directly precede an integer") from None
+
+
+def parse_ints(
+    data: bytes,
+    separators: bytes = DEFAULT_SEPARATORS,
+    record_separator: bytes = b"\n",
+) -> "tuple[np.ndarray, np.ndarray]":
+    """Tokenize every integer of a buffer at once.
+
+    Integers are runs of digits, optionally preceded by a minus sign, and may only
+    be separated by the bytes in `separators` and `record_separator`. The buffer is
+    scanned a few times at C speed and never split into Python objects.
+
+    Parameters
+    ----------
+    data : bytes
+        The buffer, e.g. the content of an input file.
+    separators : bytes, optional
+        The bytes allowed between integers of a record, by default spaces, tabs and
+        carriage returns.
+    record_separator : bytes, optional
+        The single byte ending a record, by default a new line.
+
+    Returns
+    -------
+    values : np.ndarray
+        The int64 value of every integer, in order.
+    offsets : np.ndarray
+        The int64 index in `values` of the first integer of each record, followed by
+        the number of values, so that record i is `values[offsets[i]:offsets[i + 1]]`.
+        Empty lines are empty records, and a final record separator does not start
+        a record.
+
+    Raises
+    ------
+    ValueError
+        If the buffer holds any other byte, a misplaced minus sign, or an integer
+        that does not fit in an int64.
+
+    """
+    import numpy as np
+
+    if len(record_separator) != 1:
+        raise ValueError("The record separator must be a single byte")
+    delimiters = separators + record_separator
+    _check_bytes(data, delimiters)
+
+    spaced = data.translate(bytes.maketrans(delimiters, b" " * len(delimiters)))
+    in_token = np.frombuffer(spaced, dtype=np.uint8) != ord(" ")
+    token_starts = in_token.copy()
+    token_starts[1:] &= ~in_token[:-1]
+    token_starts = np.flatnonzero(token_starts)
+    total = len(token_starts)
+
+    if total == 0:
+        # A buffer of separators would parse as a single zero.
+        values = np.zeros(0, dtype=np.int64)
+    else:
+        values = _parse_tokens(spaced)
+    if len(values) != total:
+        raise ValueError("A minus sign must directly precede an integer")
+    limits = np.iinfo(np.int64)
+    if ((values == limits.max) | (values == limits.min)).any():
+        # Larger integers are clipped to the limits.
+        raise ValueError("Integers must lie strictly between the int64 limits")
+
+    record_ends = np.flatnonzero(
+        np.frombuffer(data, dtype=np.uint8) == record_separator[0]
+    )
+    # Record i ends after the integers starting before its record separator.
+    offsets = np.concatenate(([0], np.searchsorted(token_starts, record_ends)))
+    if data and data[-1:] != record_separator:
+        offsets = np.append(offsets, total)
+    return values, offsets.astype(np.int64)
+
+
+def parse_int_rows(
+    data: bytes,
+    separators: bytes = DEFAULT_SEPARATORS,
+    record_separator: bytes = b"\n",
+) -> list[list[int]]:
+    """Split a buffer into one list of integers per record.
+
+    Large buffers are split with `parse_ints`. Small ones, and those holding
+    integers too large for an int64, are split in pure Python. Both accept the same
+    integers, runs of digits optionally preceded by a minus sign, and give the same
+    rows. Building the lists takes most of the time either way, so solutions that
+    can work on arrays should use `parse_ints` instead.
+
+    Parameters
+    ----------
+    data : bytes
+        The buffer, e.g. the content of an input file.
+    separators : bytes, optional
+        The bytes allowed between integers of a record, by default spaces, tabs and
+        carriage returns.
+    record_separator : bytes, optional
+        The single byte ending a record, by default a new line.
+
+    Returns
+    -------
+    list[list[int]]
+        The integers of each record, with an empty list for each empty line.
+
+    Raises
+    ------
+    ValueError
+        If the buffer holds anything but integers and separators.
+
+    """
+    if len(record_separator) != 1:
+        raise ValueError("The record separator must be a single byte")
+    if len(data) > SMALL_INPUT_BYTES:
+        try:
+            values, offsets = parse_ints(data, separators, record_separator)
+        except ValueError:
+            # Left to the pure Python path, which raises for malformed input.
+            pass
+        else:
+            values, offsets = values.tolist(), offsets.tolist()
+            return [values[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    # int() also accepts signs, underscores and other spellings of an integer.
+    _check_bytes(data, separators + record_separator)
+    lines = data.translate(bytes.maketrans(separators, b" " * len(separators))).split(
+        record_separator
+    )
+    if lines[-1] == b"":
+        # A final record separator does not start a record.
+        lines.pop()
+    try:
+        return [[int(token) for token in line.split(b" ") if token] for line in lines]
+    except ValueError:
+        # Only digits and minus signs are left, so a minus sign is misplaced.
+        raise ValueError("A minus sign must directly precede an integer") from None
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# Every solution module imports this one, so modules only needed while the cache is
+# enabled are imported where they are used, keeping solver start-up fast.
+import collections
+import functools
+import os
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .sources import read_bytes
+
+# The cache is only used when this environment variable names a directory
+CACHE_DIR_VARIABLE = "AOC_CACHE_DIR"
+CACHE_MAX_BYTES_VARIABLE = "AOC_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# Pickled parsed inputs by cache key, None unless `enable_memory_cache` was called
+_memory_cache: collections.OrderedDict[str, bytes] | None = None
+_memory_cache_entries = 0
+# Built indexes by cache key, kept alongside the parsed inputs
+_index_cache: collections.OrderedDict[str, Any] | None = None
+
+
+def cache_dir() -> Path | None:
+    """Return the parsed-input cache directory, or None if caching is disabled.
+
+    Returns
+    -------
+    Path | None
+        The directory named by the `AOC_CACHE_DIR` environment variable.
+
+    """
+    directory = os.environ.get(CACHE_DIR_VARIABLE)
+    return Path(directory) if directory else None
+
+
+def _save_arrays(value: Any, entry: Path) -> None:
+    import json
+
+    import numpy as np
+
+    arrays = value if isinstance(value, tuple) else (value,)
+    for i, array in enumerate(arrays):
+        np.save(entry / f"{i}.npy", array)
+    (entry / "meta.json").write_text(
+        json.dumps({"count": len(arrays), "tuple": isinstance(value, tuple)})
+    )
+
+
+def _load_arrays(entry: Path) -> Any:
+    import json
+
+    import numpy as np
+
+    meta = json.loads((entry / "meta.json").read_text())
+    arrays = tuple(
+        np.load(entry / f"{i}.npy", mmap_mode="r") for i in range(meta["count"])
+    )
+    return arrays if meta["tuple"] else arrays[0]
+
+
+def _save_ragged(value: list[list[int]], entry: Path) -> None:
+    import numpy as np
+
+    np.save(entry / "values.npy", np.fromiter((x for row in value for x in row), int))
+    np.save(entry / "lengths.npy", np.array([len(row) for row in value], dtype=int))
+
+
+def _load_ragged(entry: Path) -> list[list[int]]:
+    import numpy as np
+
+    values = np.load(entry / "values.npy").tolist()
+    rows = []
+    start = 0
+    for length in np.load(entry / "lengths.npy").tolist():
+        rows.append(values[start : start + length])
+        start += length
+    return rows
+
+
+def _save_grid(value: list[list[str]], entry: Path) -> None:
+    import numpy as np
+
+    if len({len(row) for row in value}) > 1:
+        # Ragged grids are stored as they are.
+        _save_pickle(value, entry)
+        return
+    np.save(
+        entry / "grid.npy",
+        np.frombuffer("".join(map("".join, value)).encode(), dtype=np.uint8).reshape(
+            len(value), -1
+        ),
+    )
+
+
+def _load_grid(entry: Path) -> list[list[str]]:
+    import numpy as np
+
+    if (entry / "value.pickle").exists():
+        return _load_pickle(entry)
+    grid = np.load(entry / "grid.npy", mmap_mode="r")
+    return [list(row.tobytes().decode()) for row in grid]
+
+
+def _save_pickle(value: Any, entry: Path) -> None:
+    import pickle
+
+    with (entry / "value.pickle").open("wb") as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_pickle(entry: Path) -> Any:
+    import pickle
+
+    with (entry / "value.pickle").open("rb") as file:
+        return pickle.load(file)
+
+
+# How each kind of parsed structure is stored: memory-mapped arrays for numeric
+# data, rows of integers as one flat array, grids as one byte array per map
+CODECS: dict[str, tuple[Callable[[Any, Path], None], Callable[[Path], Any]]] = {
+    "arrays": (_save_arrays, _load_arrays),
+    "ragged": (_save_ragged, _load_ragged),
+    "grid": (_save_grid, _load_grid),
+    "pickle": (_save_pickle, _load_pickle),
+}
+
+
+def _entry_size(entry: Path) -> int:
+    return sum(path.stat().st_size for path in entry.iterdir())
+
+
+def evict(directory: Path, max_bytes: int) -> None:
+    """Delete the least recently used cache entries until the cache fits its size.
+
+    Parameters
+    ----------
+    directory : Path
+        The cache directory.
+    max_bytes : int
+        The largest total size the cache entries may have.
+
+    """
+    import shutil
+
+    entries = []
+    for entry in directory.iterdir():
+        if entry.name.startswith("."):
+            # Entries still being written
+            continue
+        try:
+            entries.append((entry.stat().st_mtime, _entry_size(entry), entry))
+        except FileNotFoundError:
+            # Removed by another process in the meantime
+            continue
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda item: item[0]):
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+
+
+def enable_memory_cache(max_entries: int = 64) -> None:
+    """Keep parsed inputs and the indexes built from them in memory, for long-lived
+    processes.
+
+    Parsed inputs are kept pickled and unpickled on every hit, so callers that
+    modify the parsed structure in place never see each other's changes. Indexes
+    built by `cached_index` functions are shared, with their NumPy arrays made
+    read-only. The least recently used entries of each kind are dropped beyond
+    `max_entries`.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        The number of parsed inputs and of indexes kept, by default 64.
+
+    """
+    global _memory_cache, _memory_cache_entries, _index_cache
+    _memory_cache = collections.OrderedDict()
+    _index_cache = collections.OrderedDict()
+    _memory_cache_entries = max_entries
+
+
+def _remember(key: str, value: Any) -> None:
+    import pickle
+
+    _memory_cache[key] = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    while len(_memory_cache) > _memory_cache_entries:
+        _memory_cache.popitem(last=False)
+
+
+def cached_loader(codec: str, version: int = 1) -> Callable:
+    """Cache the result of an input loader, keyed by the content of its input.
+
+    The decorated loader is called as before unless the `AOC_CACHE_DIR` environment
+    variable names a cache directory. The loader's first argument may be any input
+    source, which is then read once and passed on as bytes. The cache key combines
+    the SHA-256 of the input, the loader's name and `version`, which must be bumped
+    whenever the loader's output changes. Every hit marks the entry as recently used,
+    and the least recently used entries are evicted once the cache grows above
+    `AOC_CACHE_MAX_BYTES` (256 MiB by default). Processes that called
+    `enable_memory_cache` look entries up in memory first.
+
+    Parameters
+    ----------
+    codec : str
+        How to store the parsed structure, one of the keys of `CODECS`.
+    version : int, optional
+        The version of the parser, by default 1.
+
+    Returns
+    -------
+    Callable
+        The decorator.
+
+    """
+    save, load = CODECS[codec]
+
+    def decorator(loader: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(loader)
+        def wrapper(*args, **kwargs) -> Any:
+            directory = cache_dir()
+            if directory is None and _memory_cache is None:
+                return loader(*args, **kwargs)
+
+            import hashlib
+            import inspect
+            import pickle
+            import shutil
+            import tempfile
+
+            bound = inspect.signature(loader).bind(*args, **kwargs)
+            bound.apply_defaults()
+            name, source = next(iter(bound.arguments.items()))
+            # Read once and handed to the loader, as streams cannot be read twice.
+            data = read_bytes(source)
+            bound.arguments[name] = data
+
+            digest = hashlib.sha256(data)
+            digest.update(f"{loader.__module__}.{loader.__qualname__}".encode())
+            digest.update(f"v{version}".encode())
+            key = digest.hexdigest()
+
+            if _memory_cache is not None and key in _memory_cache:
+                _memory_cache.move_to_end(key)
+                return pickle.loads(_memory_cache[key])
+            if directory is None:
+                value = loader(*bound.args, **bound.kwargs)
+                _remember(key, value)
+                return value
+
+            entry = directory / key
+            try:
+                value = load(entry)
+                os.utime(entry)
+                if _memory_cache is not None:
+                    _remember(key, value)
+                return value
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+
+            value = loader(*bound.args, **bound.kwargs)
+            if _memory_cache is not None:
+                _remember(key, value)
+            directory.mkdir(parents=True, exist_ok=True)
+            staging = Path(tempfile.mkdtemp(dir=directory, prefix=".staging-"))
+            save(value, staging)
+            try:
+                # Atomic, so concurrent readers only ever see complete entries.
+                os.rename(staging, entry)
+            except OSError:
+                # Another process stored the same entry first.
+                shutil.rmtree(staging, ignore_errors=True)
+            evict(
+                directory,
+                int(os.environ.get(CACHE_MAX_BYTES_VARIABLE, DEFAULT_MAX_BYTES)),
+            )
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def _read_only(value: Any) -> None:
+    """Make the NumPy arrays of an index, alone or in a tuple, read-only."""
+    if isinstance(value, tuple):
+        for item in value:
+            _read_only(item)
+        return
+    # No array was built if NumPy was never imported.
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        value.flags.writeable = False
+
+
+def cached_index(builder: Callable[..., Any]) -> Callable[..., Any]:
+    """Keep the indexes built by a function in memory once `enable_memory_cache` was
+    called, keyed by the content of its arguments.
+
+    Unlike parsed inputs, indexes are returned as they were built rather than
+    copied, so that a hit costs no more than hashing the arguments. Callers must
+    not modify them, and NumPy arrays, returned alone or in a tuple, are made
+    read-only so that writing to them raises.
+
+    Parameters
+    ----------
+    builder : Callable[..., Any]
+        The function building an index from a parsed input. Its arguments must be
+        picklable.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The decorated function.
+
+    """
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs) -> Any:
+        if _index_cache is None:
+            return builder(*args, **kwargs)
+
+        import hashlib
+        import pickle
+
+        digest = hashlib.sha256(
+            pickle.dumps((args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        digest.update(f"{builder.__module__}.{builder.__qualname__}".encode())
+        key = digest.hexdigest()
+
+        if key in _index_cache:
+            _index_cache.move_to_end(key)
+            return _index_cache[key]
+        value = builder(*args, **kwargs)
+        _read_only(value)
+        _index_cache[key] = value
+        while len(_index_cache) > _memory_cache_entries:
+            _index_cache.popitem(last=False)
+        return value
+
+    return wrapper
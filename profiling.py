@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+import contextlib
+import os
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Setting this environment variable to a report path profiles runner invocations,
+# each one writing its own report next to that path
+PROFILE_VARIABLE = "AOC_PROFILE"
+
+DEFAULT_REPORT_PATH = "profile.json"
+
+# Stage durations of the run being recorded, None when stages are not recorded
+_stage_seconds: dict[str, float] | None = None
+
+_NO_STAGE = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _timed_stage(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if _stage_seconds is not None:
+            _stage_seconds[name] = (
+                _stage_seconds.get(name, 0.0) + time.perf_counter() - start
+            )
+
+
+def stage(name: str) -> contextlib.AbstractContextManager:
+    """Mark a named stage of a solver, such as "parse", "index", "search" or
+    "reduce".
+
+    Outside of `record_stages` this returns a shared no-op context manager, so
+    stages cost one function call and should wrap whole phases, never loop bodies.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage. Durations of stages with the same name add up.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        A context manager timing the stage while stages are recorded.
+
+    """
+    if _stage_seconds is None:
+        return _NO_STAGE
+    return _timed_stage(name)
+
+
+@contextlib.contextmanager
+def record_stages() -> Iterator[dict[str, float]]:
+    """Time the stages of the solvers run inside the block, without profiling them.
+
+    Yields
+    ------
+    dict[str, float]
+        The seconds spent in each stage, filled in as the stages end.
+
+    """
+    global _stage_seconds
+    previous, _stage_seconds = _stage_seconds, {}
+    try:
+        yield _stage_seconds
+    finally:
+        _stage_seconds = previous
+
+
+def labelled_report_path(report_path: str, label: str) -> str:
+    """Insert a label before the suffix of a report path.
+
+    Parameters
+    ----------
+    report_path : str
+        The path of a report, e.g. "report.json".
+    label : str
+        The label, e.g. "day05.b".
+
+    Returns
+    -------
+    str
+        The labelled path, e.g. "report.day05.b.json".
+
+    """
+    path = Path(report_path)
+    return str(path.with_name(f"{path.stem}.{label}{path.suffix or '.json'}"))
+
+
+def profile_run(
+    solve: Callable[[str], Any],
+    filename: str | bytes,
+    report_path: str | None = None,
+    top: int = 25,
+) -> Any:
+    """Run a solve function under cProfile and tracemalloc and write a report.
+
+    The JSON report holds the total time, the time spent in each stage, the peak
+    traced memory, the largest allocation sites and the cProfile functions with the
+    highest cumulative time. The raw cProfile stats are saved next to it with a
+    `.prof` suffix.
+
+    Parameters
+    ----------
+    solve : Callable[[str], Any]
+        The solve function.
+    filename : str | bytes
+        The path of the input file, or its content.
+    report_path : str, optional
+        The path of the JSON report. By default, the path named by the `AOC_PROFILE`
+        environment variable, or "profile.json", labelled with the solve function's
+        module and name as by `labelled_report_path`, so that profiling several
+        functions writes one report each.
+    top : int, optional
+        The number of allocation sites and functions reported, by default 25.
+
+    Returns
+    -------
+    Any
+        The answer returned by the solve function.
+
+    """
+    # Imported here since every solution module imports this one.
+    import cProfile
+    import io
+    import json
+    import pstats
+    import tracemalloc
+
+    function = f"{solve.__module__}.{solve.__qualname__}"
+    if report_path is None:
+        report_path = labelled_report_path(
+            os.environ.get(PROFILE_VARIABLE) or DEFAULT_REPORT_PATH, function
+        )
+
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with record_stages() as stage_seconds:
+        try:
+            profiler.enable()
+            answer = solve(filename)
+        finally:
+            profiler.disable()
+            total_seconds = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot()
+            _, peak_traced = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    stats_text = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stats_text)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.dump_stats(Path(report_path).with_suffix(".prof"))
+
+    report = {
+        "function": function,
+        "input": os.path.abspath(filename) if isinstance(filename, str) else None,
+        "total_seconds": total_seconds,
+        "stage_seconds": stage_seconds,
+        "peak_traced_bytes": peak_traced,
+        "top_allocations": [
+            {
+                "location": str(statistic.traceback),
+                "size_bytes": statistic.size,
+                "count": statistic.count,
+            }
+            for statistic in snapshot.statistics("lineno")[:top]
+        ],
+        "cprofile": stats_text.getvalue(),
+    }
+    with Path(report_path).open("w") as file:
+        json.dump(report, file, indent=2)
+    return answer
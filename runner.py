@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+import argparse
+import importlib
+import os
+import re
+import resource
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+
+from .answer_cache import cached_solve
+from .profiling import (
+    PROFILE_VARIABLE,
+    labelled_report_path,
+    profile_run,
+    record_stages,
+)
+from .sources import STDIN
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+# The input loader of each day, tried in order
+PARSER_NAMES = (
+    "load_and_split_data",
+    "load_data",
+    "load_grid",
+    "load_input",
+    "parse_file",
+)
+
+
+def discover_days() -> dict[int, str]:
+    """Find every day package that has a solution module.
+
+    Returns
+    -------
+    dict[int, str]
+        The module name of each day's solution, keyed by day number.
+
+    """
+    days = {}
+    for path in sorted(PACKAGE_DIR.glob("day[0-9][0-9]/sol.py")):
+        day = int(re.fullmatch(r"day(\d\d)", path.parent.name).group(1))
+        days[day] = f"{__package__}.{path.parent.name}.sol"
+    return days
+
+
+def load_day(day: int) -> ModuleType:
+    """Import the solution module of a day.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+
+    Returns
+    -------
+    ModuleType
+        The imported `dayNN.sol` module.
+
+    """
+    days = discover_days()
+    if day not in days:
+        raise ValueError(f"No solution found for day {day}")
+    return importlib.import_module(days[day])
+
+
+def default_input(day: int) -> Path:
+    """Return the path of a day's puzzle input.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+
+    Returns
+    -------
+    Path
+        The `input.txt` file next to the day's solution.
+
+    """
+    return PACKAGE_DIR / f"day{day:02d}" / "input.txt"
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of the process.
+
+    Returns
+    -------
+    int
+        The peak resident set size in bytes.
+
+    """
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        peak_rss *= 1024
+    return peak_rss
+
+
+def run(
+    day: int,
+    part: str,
+    filename: str | bytes,
+    function: str | None = None,
+    use_cache: bool = False,
+    profile: str | None = None,
+) -> dict:
+    """Run one part of a day and measure it.
+
+    Parameters
+    ----------
+    day : int
+        The day number.
+    part : str
+        Either "a" or "b".
+    filename : str | bytes
+        The path of the input file, or its content.
+    function : str, optional
+        The name of the solve function to run instead of `solve_part_<part>`, e.g. a
+        faster engine taking the same input, by default None.
+    use_cache : bool, optional
+        Whether to return the cached answer if the input and the day's code are
+        unchanged since it was computed, by default False.
+    profile : str, optional
+        The path of a report to write with the cProfile statistics, the largest
+        allocation sites and the time of each stage of the solve function, by default
+        None. Profiling slows the solve function down and bypasses the answer cache.
+
+    Returns
+    -------
+    dict
+        The answer, whether it came from the cache, the time the solve function spent
+        in its "parse" stage and the rest of its time, the time of each of its stages
+        and the peak resident set size of the process in bytes. Stage times are None
+        when the answer is cached or profiled, as profiling reports them itself.
+
+    """
+    if part not in ("a", "b"):
+        raise ValueError(f"Invalid part: {part}")
+    module = load_day(day)
+    function = function or f"solve_part_{part}"
+
+    cached = False
+    stage_seconds = None
+    start = time.perf_counter()
+    if profile:
+        answer = profile_run(getattr(module, function), filename, profile)
+    elif use_cache:
+        answer, cached = cached_solve(module, function, filename)
+    else:
+        # The solver's own stages, so that the parse time is that of the loader it
+        # actually uses.
+        with record_stages() as stage_seconds:
+            answer = getattr(module, function)(filename)
+    solve_seconds = time.perf_counter() - start
+
+    parse_seconds = None
+    if stage_seconds is not None and "parse" in stage_seconds:
+        parse_seconds = stage_seconds["parse"]
+        solve_seconds -= parse_seconds
+
+    return {
+        "day": day,
+        "part": part,
+        "function": function,
+        "answer": answer,
+        "cached": cached,
+        "parse_seconds": parse_seconds,
+        "solve_seconds": solve_seconds,
+        "stage_seconds": stage_seconds,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a day from the command line.
+
+    The answer is printed to stdout and the measurements to stderr. The day is
+    solved by the daemon if one is running, unless it is profiled.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {__package__}")
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", choices=("a", "b"))
+    parser.add_argument(
+        "input", nargs="?", help="defaults to the day's input.txt, - for stdin"
+    )
+    parser.add_argument("--function", help="solve function to run instead")
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse answers for unchanged inputs"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT",
+        help=f"write a profiling report, by default next to ${PROFILE_VARIABLE} if set",
+    )
+    parser.add_argument(
+        "--no-daemon", action="store_true", help="solve here even if a daemon runs"
+    )
+    args = parser.parse_args(argv)
+    if not args.profile and os.environ.get(PROFILE_VARIABLE):
+        # One report per day and part, so that successive runs keep their reports.
+        label = f"day{args.day:02d}.{args.part}"
+        if args.function:
+            label += f".{args.function}"
+        args.profile = labelled_report_path(os.environ[PROFILE_VARIABLE], label)
+
+    # Imported here as the daemon imports this module.
+    from .daemon import daemon_socket, solve_remote
+
+    filename = args.input or str(default_input(args.day))
+    if filename == STDIN:
+        # Read once here, as the input is parsed again to time the parser.
+        filename = sys.stdin.buffer.read()
+    result = None
+    if (
+        isinstance(filename, str)
+        and not (args.profile or args.no_daemon)
+        and daemon_socket().exists()
+    ):
+        try:
+            result = solve_remote(args.day, args.part, filename, args.function)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # The daemon stopped, or left its socket behind when it crashed.
+            pass
+    if result is None:
+        result = run(
+            args.day, args.part, filename, args.function, args.cache, args.profile
+        )
+
+    print(result["answer"])
+    if result["parse_seconds"] is not None:
+        print(f"parse: {result['parse_seconds']:.6f} s", file=sys.stderr)
+    source = "cached" if result["cached"] else result["function"]
+    print(f"solve: {result['solve_seconds']:.6f} s ({source})", file=sys.stderr)
+    for name, seconds in (result.get("stage_seconds") or {}).items():
+        if name != "parse":
+            print(f"  {name}: {seconds:.6f} s", file=sys.stderr)
+    if result["peak_rss_bytes"] is not None:
+        peak = f"{result['peak_rss_bytes'] / 2**20:.1f} MiB"
+    else:
+        peak = (
+            f"{result['daemon_peak_rss_bytes'] / 2**20:.1f} MiB "
+            "since the daemon started"
+        )
+    print(f"peak memory: {peak}", file=sys.stderr)
+    if args.profile:
+        print(f"profile: {args.profile}", file=sys.stderr)
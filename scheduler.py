@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
+
+from .runner import default_input, discover_days, run
+
+HISTORY_VARIABLE = "AOC_SCHEDULE_HISTORY"
+
+
+class Task(NamedTuple):
+    """One solve function run on one input."""
+
+    day: int
+    part: str
+    filename: str
+    function: str | None = None
+
+    @property
+    def key(self) -> str:
+        """The name the task's durations are recorded under."""
+        return f"day{self.day:02d}.{self.function or f'solve_part_{self.part}'}"
+
+
+def history_path() -> Path:
+    """Return the file the task durations are recorded in.
+
+    Returns
+    -------
+    Path
+        The file named by the `AOC_SCHEDULE_HISTORY` environment variable, by default
+        `~/.cache/aoc2024/durations.json`.
+
+    """
+    path = os.environ.get(HISTORY_VARIABLE)
+    if path:
+        return Path(path)
+    return Path.home() / ".cache" / "aoc2024" / "durations.json"
+
+
+def load_history(path: Path) -> dict[str, float]:
+    """Load the last recorded duration of each task.
+
+    Parameters
+    ----------
+    path : Path
+        The history file.
+
+    Returns
+    -------
+    dict[str, float]
+        The duration in seconds, keyed by `Task.key`. Empty if there is no history
+        yet.
+
+    """
+    try:
+        with path.open() as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_history(path: Path, history: dict[str, float]) -> None:
+    """Save the task durations, replacing the history file atomically.
+
+    Parameters
+    ----------
+    path : Path
+        The history file.
+    history : dict[str, float]
+        The duration in seconds, keyed by `Task.key`.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, staging = tempfile.mkstemp(dir=path.parent, prefix=".staging-")
+    with os.fdopen(descriptor, "w") as file:
+        json.dump(history, file, indent=2, sort_keys=True)
+    os.replace(staging, path)
+
+
+def all_tasks(
+    days: list[int] | None = None, parts: tuple[str, ...] = ("a", "b")
+) -> list[Task]:
+    """List both parts of every day that has a puzzle input.
+
+    Parameters
+    ----------
+    days : list[int], optional
+        The days to run, by default every day with a solution.
+    parts : tuple[str, ...], optional
+        The parts to run, by default both.
+
+    Returns
+    -------
+    list[Task]
+        The tasks, skipping days without an `input.txt`.
+
+    """
+    return [
+        Task(day, part, str(default_input(day)))
+        for day in days or discover_days()
+        if default_input(day).exists()
+        for part in parts
+    ]
+
+
+def schedule(tasks: list[Task], history: dict[str, float]) -> list[Task]:
+    """Order tasks longest expected first.
+
+    Tasks without a recorded duration go first, since they may be the longest.
+
+    Parameters
+    ----------
+    tasks : list[Task]
+        The tasks to run.
+    history : dict[str, float]
+        The last recorded duration of each task.
+
+    Returns
+    -------
+    list[Task]
+        The tasks in the order they should be started.
+
+    """
+    return sorted(
+        tasks, key=lambda task: history.get(task.key, float("inf")), reverse=True
+    )
+
+
+def _run_task(task: Task) -> dict:
+    """Run one task in a worker, reporting a failure instead of raising it."""
+    # Progress output of the solvers must not end up in the report on stdout.
+    with contextlib.redirect_stdout(sys.stderr):
+        start = time.perf_counter()
+        try:
+            result = run(task.day, task.part, task.filename, task.function)
+        except Exception as error:
+            return {
+                "day": task.day,
+                "part": task.part,
+                "function": task.function or f"solve_part_{task.part}",
+                "error": f"{type(error).__name__}: {error}",
+            }
+    result["task_seconds"] = time.perf_counter() - start
+    # Workers are reused, so their peak includes the tasks they ran before.
+    result["worker_peak_rss_bytes"] = result["peak_rss_bytes"]
+    result["peak_rss_bytes"] = None
+    return result
+
+
+def run_all(
+    tasks: list[Task],
+    max_workers: int | None = None,
+    history_file: Path | None = None,
+) -> dict:
+    """Run tasks on a pool of processes, longest expected first.
+
+    Each worker takes the next task as soon as it is free, so once the slow tasks
+    are started first the total time approaches that of the slowest one. The
+    duration of every successful task, parsing included, is recorded for the next
+    schedule.
+
+    Parameters
+    ----------
+    tasks : list[Task]
+        The tasks to run.
+    max_workers : int, optional
+        The number of processes, by default the number of CPUs.
+    history_file : Path, optional
+        The history file, by default `history_path()`.
+
+    Returns
+    -------
+    dict
+        The total wall time, and the result of every task as returned by
+        `runner.run` in day and part order, with an "error" instead of the answer
+        for failed tasks. Each result also holds the task's wall time in
+        "task_seconds", and the peak resident set size of the worker that ran it,
+        over every task that worker ran so far, in "worker_peak_rss_bytes" instead
+        of "peak_rss_bytes".
+
+    """
+    history_file = history_file or history_path()
+    history = load_history(history_file)
+    ordered = schedule(tasks, history)
+
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {executor.submit(_run_task, task): task for task in ordered}
+        for future in as_completed(futures):
+            result = future.result()
+            if "error" not in result:
+                history[futures[future].key] = result["task_seconds"]
+            results.append(result)
+    wall_seconds = time.perf_counter() - start
+
+    save_history(history_file, history)
+    results.sort(key=lambda result: (result["day"], result["part"]))
+    return {"wall_seconds": wall_seconds, "results": results}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run every day from the command line.
+
+    Parameters
+    ----------
+    argv : list[str], optional
+        The command line arguments, by default `sys.argv[1:]`.
+
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m {__package__}.scheduler")
+    parser.add_argument("--days", type=int, nargs="+")
+    parser.add_argument("--parts", nargs="+", choices=("a", "b"), default=["a", "b"])
+    parser.add_argument("--workers", type=int, help="defaults to the number of CPUs")
+    parser.add_argument("--history", help=f"defaults to ${HISTORY_VARIABLE}")
+    parser.add_argument("--output", default="schedule_report.json")
+    args = parser.parse_args(argv)
+
+    report = run_all(
+        all_tasks(args.days, tuple(args.parts)),
+        args.workers,
+        Path(args.history) if args.history else None,
+    )
+    with Path(args.output).open("w") as file:
+        json.dump(report, file, indent=2)
+
+    failed = False
+    for result in report["results"]:
+        if "error" in result:
+            failed = True
+            outcome = f"failed ({result['error']})"
+        else:
+            outcome = f"{result['answer']} in {result['task_seconds']:.6f} s"
+        print(f"day {result['day']} part {result['part']}: {outcome}")
+    print(f"total: {report['wall_seconds']:.6f} s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+import mmap
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+# An input: a path ("-" for stdin), a binary file object, or its content in memory
+Source = str | os.PathLike | bytes | bytearray | memoryview | mmap.mmap | BinaryIO
+
+STDIN = "-"
+
+DEFAULT_CHUNK_SIZE = 2**20
+
+
+def _in_memory(source: Source) -> bool:
+    return isinstance(source, (bytes, bytearray, memoryview, mmap.mmap))
+
+
+def _resolve(source: Source) -> Source:
+    # Looked up on every call, so that stdin may be replaced.
+    return sys.stdin.buffer if isinstance(source, str) and source == STDIN else source
+
+
+def _is_path(source: Source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def read_bytes(source: Source) -> bytes:
+    """Read the whole content of an input.
+
+    Parameters
+    ----------
+    source : Source
+        The path of a file, "-" for stdin, a binary file object read from its
+        current position, or the content itself as bytes, a buffer or an mmap.
+
+    Returns
+    -------
+    bytes
+        The content. Bytes are returned as they are, and other buffers are copied
+        once.
+
+    """
+    source = _resolve(source)
+    if isinstance(source, bytes):
+        return source
+    if _in_memory(source):
+        return bytes(source)
+    if _is_path(source):
+        return Path(source).read_bytes()
+    return source.read()
+
+
+def read_text(source: Source) -> str:
+    """Read the whole content of an input as text, like a file opened in text mode.
+
+    Parameters
+    ----------
+    source : Source
+        The input, as accepted by `read_bytes`.
+
+    Returns
+    -------
+    str
+        The content decoded as UTF-8, with every line ending turned into "\\n".
+
+    """
+    return read_bytes(source).decode().replace("\r\n", "\n").replace("\r", "\n")
+
+
+def iter_chunks(source: Source, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Iterate over an input in chunks, without reading it all into memory.
+
+    Parameters
+    ----------
+    source : Source
+        The input, as accepted by `read_bytes`.
+    size : int, optional
+        The largest size of a chunk in bytes, by default 1 MiB.
+
+    Yields
+    ------
+    bytes
+        The consecutive chunks. Inputs in memory yield memoryviews on their content
+        instead of copies, which must be released before an mmap is closed.
+
+    """
+    source = _resolve(source)
+    if _in_memory(source):
+        view = memoryview(source)
+        for start in range(0, len(view), size):
+            yield view[start : start + size]
+        return
+    if _is_path(source):
+        with Path(source).open("rb") as file:
+            yield from iter(lambda: file.read(size), b"")
+        return
+    yield from iter(lambda: source.read(size), b"")
+
+
+def iter_lines(source: Source) -> Iterator[bytes]:
+    """Iterate over the lines of an input, without reading it all into memory.
+
+    Parameters
+    ----------
+    source : Source
+        The input, as accepted by `read_bytes`.
+
+    Yields
+    ------
+    bytes
+        Each line, ending with "\\n" except for a last line without one.
+
+    """
+    source = _resolve(source)
+    if _in_memory(source):
+        # memoryviews have no find method.
+        content = source.tobytes() if isinstance(source, memoryview) else source
+        start = 0
+        while start < len(content):
+            end = content.find(b"\n", start) + 1 or len(content)
+            yield bytes(content[start:end])
+            start = end
+        return
+    if _is_path(source):
+        with Path(source).open("rb") as file:
+            yield from file
+        return
+    yield from source
@@ -0,0 +1,56 @@
+import shutil
+from pathlib import Path
+from types import ModuleType
+
+from .answer_cache import cached_solve, source_digest
+from .runner import load_day, run
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+def test_cached_solve_hits_for_unchanged_input(tmp_path):
+    filename = tmp_path / "input.txt"
+    shutil.copy(TEST_DIR / "day07" / "test_input.txt", filename)
+    module = load_day(7)
+    cache = tmp_path / "cache"
+
+    assert cached_solve(module, "solve_part_b", str(filename), cache) == (11387, False)
+    assert cached_solve(module, "solve_part_b", str(filename), cache) == (11387, True)
+    assert cached_solve(module, "solve_part_a", str(filename), cache) == (3749, False)
+
+    filename.write_text("190: 10 19\n")
+    assert cached_solve(module, "solve_part_b", str(filename), cache) == (190, False)
+
+
+def test_run_with_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_ANSWER_CACHE_DIR", str(tmp_path))
+    filename = str(TEST_DIR / "day01" / "test_input.txt")
+    assert run(1, "b", filename, use_cache=True)["cached"] is False
+    result = run(1, "b", filename, use_cache=True)
+    assert (result["answer"], result["cached"]) == (31, True)
+
+
+def test_cached_solve_keeps_tuples(tmp_path):
+    filename = str(TEST_DIR / "day07" / "test_input.txt")
+    module = load_day(7)
+    for cached in (False, True):
+        assert cached_solve(module, "solve_both_parts", filename, tmp_path) == (
+            (3749, 11387),
+            cached,
+        )
+
+
+def test_source_digest_follows_relative_imports(tmp_path):
+    (tmp_path / "day01").mkdir()
+    (tmp_path / "day01" / "sol.py").write_text("from ..helper import parse\n")
+    (tmp_path / "helper.py").write_text("from .sources import read\n")
+    (tmp_path / "sources.py").write_text("read = None\n")
+    (tmp_path / "unused.py").write_text("")
+    module = ModuleType("day01.sol")
+    module.__file__ = str(tmp_path / "day01" / "sol.py")
+
+    digest = source_digest(module)
+    (tmp_path / "unused.py").write_text("changed = True\n")
+    assert source_digest(module) == digest
+    (tmp_path / "sources.py").write_text("read = print\n")
+    assert source_digest(module) != digest
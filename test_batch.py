@@ -0,0 +1,50 @@
+import json
+import shutil
+from pathlib import Path
+
+from .batch import input_files, main, solve_batch
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+def test_input_files(tmp_path):
+    for name in ("b.txt", "a.txt", "notes.md"):
+        (tmp_path / name).touch()
+    manifest = tmp_path / "manifest"
+    manifest.write_text("# inputs\nb.txt\n\n/elsewhere/c.txt\n")
+
+    assert input_files(directory=str(tmp_path)) == [
+        str(tmp_path / "a.txt"),
+        str(tmp_path / "b.txt"),
+    ]
+    assert input_files(manifest=str(manifest)) == [
+        str(tmp_path / "b.txt"),
+        "/elsewhere/c.txt",
+    ]
+
+
+def test_solve_batch(tmp_path):
+    filenames = []
+    for i in range(20):
+        filename = tmp_path / f"{i}.txt"
+        if i % 2:
+            filename.write_text("190: 10 19\n")
+        else:
+            shutil.copy(TEST_DIR / "day07" / "test_input.txt", filename)
+        filenames.append(str(filename))
+    filenames.append(str(tmp_path / "missing.txt"))
+
+    results = list(solve_batch(7, "b", filenames, max_workers=2, chunksize=3))
+
+    assert [result["input"] for result in results] == filenames
+    assert [result.get("answer") for result in results] == [11387, 190] * 10 + [None]
+    assert all(result["seconds"] >= 0 for result in results[:-1])
+    assert results[-1]["error"].startswith("FileNotFoundError")
+
+
+def test_main_streams_json_lines(tmp_path, capsys):
+    shutil.copy(TEST_DIR / "day01" / "test_input.txt", tmp_path / "input.txt")
+    main(["1", "b", "--directory", str(tmp_path), "--workers", "1"])
+    (line,) = capsys.readouterr().out.splitlines()
+    result = json.loads(line)
+    assert (result["day"], result["part"], result["answer"]) == (1, "b", 31)
@@ -0,0 +1,84 @@
+from . import benchmark
+from .benchmark import find_regressions, run_benchmarks, run_case, scale_input
+
+
+def test_scale_input_line_based():
+    assert scale_input(1, "3   4\n4   3\n", 3) == "3   4\n4   3\n" * 3
+
+
+def test_scale_input_day05_repeats_updates_only():
+    content = "47|53\n97|13\n\n75,47,61\n97,13,75\n"
+    assert scale_input(5, content, 2) == (
+        "47|53\n97|13\n\n75,47,61\n97,13,75\n75,47,61\n97,13,75\n"
+    )
+
+
+def test_scale_input_grid_keeps_one_guard():
+    scaled = scale_input(6, "..\n.^\n", 4)
+    assert scaled == "....\n.^..\n....\n....\n"
+
+
+def test_run_benchmarks_and_find_regressions():
+    results = run_benchmarks([1], ["a"], [1, 2])
+    assert [result["scale"] for result in results] == [1, 2]
+    assert all(result["answer"] > 0 for result in results)
+
+    slower = [
+        dict(result, wall_seconds=result["wall_seconds"] * 10) for result in results
+    ]
+    assert len(find_regressions(slower, results)) == 2
+    assert find_regressions(results, results) == []
+
+
+def test_run_benchmarks_synthetic_checks_answers():
+    results = run_benchmarks([5], ["a", "b"], [1], synthetic=True)
+    assert all(result["answer"] == result["expected"] for result in results)
+    assert find_regressions(results, []) == []
+
+    wrong = [dict(result, expected=result["expected"] + 1) for result in results]
+    assert len(find_regressions(wrong, [])) == 2
+
+
+def test_run_case_reports_solver_errors(tmp_path):
+    result = run_case(5, "b", str(tmp_path / "missing.txt"))
+    assert result["error"].startswith("FileNotFoundError")
+    assert find_regressions([dict(result, day=5, part="b", scale=1)], []) == [
+        f"day 5 part b x1: {result['error']}"
+    ]
+
+
+def test_run_case_skips_cases_that_time_out(tmp_path):
+    filename = tmp_path / "input.txt"
+    filename.write_text("3   4\n4   3\n")
+    # Starting the process alone takes longer.
+    assert run_case(1, "a", str(filename), timeout=0.001) == {
+        "skipped": "timed out after 0.001 s"
+    }
+
+
+def test_run_benchmarks_skips_larger_scales_after_a_timeout(monkeypatch):
+    def fake_run_case(day, part, filename, function, timeout):
+        if part == "b" and "_x10." in filename:
+            return {"skipped": f"timed out after {timeout:g} s"}
+        return {"answer": 1, "wall_seconds": 0.0}
+
+    monkeypatch.setattr(benchmark, "run_case", fake_run_case)
+    results = run_benchmarks([1], ["a", "b"], [1, 10, 100], timeout=5)
+    outcomes = [
+        (result["part"], result["scale"], result.get("skipped")) for result in results
+    ]
+    assert outcomes == [
+        ("a", 1, None),
+        ("b", 1, None),
+        ("a", 10, None),
+        ("b", 10, "timed out after 5 s"),
+        ("a", 100, None),
+        ("b", 100, "timed out at x10 already"),
+    ]
+
+    baseline = [dict(result, wall_seconds=0.0) for result in results]
+    assert find_regressions(results, baseline) == []
+    baseline[3] = {"day": 1, "part": "b", "scale": 10, "wall_seconds": 0.0}
+    assert find_regressions(results, baseline) == [
+        "day 1 part b x10: timed out after 5 s"
+    ]
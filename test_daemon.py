@@ -0,0 +1,132 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from . import parse_cache
+from .daemon import SolveServer, request, solve_remote
+from .runner import main
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    # The daemon keeps parsed inputs and indexes in memory, which must not leak into
+    # other tests.
+    monkeypatch.setattr(parse_cache, "_memory_cache", None)
+    monkeypatch.setattr(parse_cache, "_index_cache", None)
+    path = tmp_path / "daemon.sock"
+    monkeypatch.setenv("AOC_DAEMON_SOCKET", str(path))
+    server = SolveServer(str(path))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield path
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_solve_remote_caches_answers(daemon):
+    filename = str(TEST_DIR / "day07" / "test_input.txt")
+    first = solve_remote(7, "b", filename)
+    assert (first["answer"], first["cached"]) == (11387, False)
+    second = solve_remote(7, "b", filename, "solve_part_b")
+    assert (second["answer"], second["cached"]) == (11387, True)
+    assert solve_remote(7, "b", filename, "solve_part_b_backward")["cached"] is False
+
+    assert request({"op": "stats"}) == {
+        "days": [1, 2, 3, 4, 5, 6, 7],
+        "answers": 2,
+        "requests": 3,
+    }
+
+
+def test_errors_are_reported(daemon, tmp_path):
+    with pytest.raises(RuntimeError, match="FileNotFoundError"):
+        solve_remote(1, "a", str(tmp_path / "missing.txt"))
+    with pytest.raises(RuntimeError, match="No solution found for day 30"):
+        solve_remote(30, "a", str(tmp_path / "missing.txt"))
+    # The daemon keeps serving after an error.
+    assert (
+        solve_remote(1, "a", str(TEST_DIR / "day01" / "test_input.txt"))["answer"] == 11
+    )
+
+
+def test_runner_uses_running_daemon(daemon, capsys):
+    main(["1", "b", str(TEST_DIR / "day01" / "test_input.txt")])
+    main(["1", "b", str(TEST_DIR / "day01" / "test_input.txt")])
+    output = capsys.readouterr()
+    assert output.out == "31\n31\n"
+    assert "(cached)" in output.err
+    assert request({"op": "stats"})["requests"] == 2
+
+
+def test_runner_ignores_stale_socket(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(parse_cache, "_memory_cache", None)
+    monkeypatch.setattr(parse_cache, "_index_cache", None)
+    path = tmp_path / "daemon.sock"
+    monkeypatch.setenv("AOC_DAEMON_SOCKET", str(path))
+    SolveServer(str(path)).server_close()
+    assert path.exists()
+    main(["1", "a", str(TEST_DIR / "day01" / "test_input.txt")])
+    assert capsys.readouterr().out == "11\n"
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(parse_cache, "_memory_cache", None)
+    monkeypatch.setattr(parse_cache, "_index_cache", None)
+    server = SolveServer(str(tmp_path / "daemon.sock"), max_answers=2)
+    yield server
+    server.server_close()
+
+
+def _solve_request(day, part):
+    return {
+        "day": day,
+        "part": part,
+        "input": str(TEST_DIR / f"day{day:02d}" / "test_input.txt"),
+    }
+
+
+def test_daemon_bounds_answers(server):
+    for day, part in [(1, "a"), (1, "b"), (2, "a"), (1, "b")]:
+        response = server.respond(_solve_request(day, part))
+    assert response["cached"] is True
+    assert response["peak_rss_bytes"] is None
+    assert response["daemon_peak_rss_bytes"] > 0
+    assert server.respond({"op": "stats"})["answers"] == 2
+    assert server.respond(_solve_request(1, "a"))["cached"] is False
+
+
+def _edited_input(day, tmp_path):
+    # The same input with other line endings, as answers for unchanged code and
+    # input are served from memory
+    content = (TEST_DIR / f"day{day:02d}" / "test_input.txt").read_bytes()
+    filename = tmp_path / f"day{day:02d}.txt"
+    filename.write_bytes(content.replace(b"\n", b"\r\n"))
+    return dict(_solve_request(day, "a"), input=str(filename))
+
+
+def test_daemon_reloads_changed_solution(server, monkeypatch, tmp_path):
+    module = server.modules[1]
+    monkeypatch.setattr(module, "solve_part_a", lambda filename: 0)
+    assert server.respond(_solve_request(1, "a"))["answer"] == 0
+
+    # As if the solution had been edited
+    server.stamps[Path(module.__file__).resolve()] = (0, 0)
+    assert server.respond(_edited_input(1, tmp_path))["answer"] == 11
+    assert server.modules[1] is module
+
+
+def test_daemon_reloads_every_solution_when_shared_code_changes(
+    server, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(server.modules[2], "solve_part_a", lambda filename: 0)
+    assert server.respond(_solve_request(2, "a"))["answer"] == 0
+
+    server.stamps[TEST_DIR / "intparse.py"] = (0, 0)
+    assert server.respond(_edited_input(1, tmp_path))["answer"] == 11
+    assert server.respond(_edited_input(2, tmp_path))["answer"] == 2
+    assert parse_cache._memory_cache is not None
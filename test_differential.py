@@ -0,0 +1,26 @@
+import pytest
+
+from .day07.sol import can_form_target
+from .differential import ENGINE_PAIRS, EnginePair, check_engine
+
+
+@pytest.mark.parametrize("name", sorted(ENGINE_PAIRS))
+def test_engine_matches_reference(name):
+    assert check_engine(ENGINE_PAIRS[name], trials=300) is None
+
+
+def test_check_engine_shrinks_mismatch():
+    def broken(nums, target):
+        # Wrong whenever a number has two digits
+        return can_form_target(nums, target) != (max(nums) >= 10)
+
+    pair = EnginePair(
+        "broken",
+        lambda rng: ([rng.randint(1, 50) for _ in range(5)], rng.randint(0, 100)),
+        can_form_target,
+        broken,
+    )
+    mismatch = check_engine(pair)
+    assert mismatch is not None
+    assert mismatch.args == ([10], 0)
+    assert (mismatch.expected, mismatch.actual) == (False, True)
@@ -0,0 +1,21 @@
+import pytest
+
+from .generators import GENERATORS, generate
+from .runner import load_day
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_generated_answers_match_reference_solvers(day, seed, tmp_path):
+    content, answers = generate(day, 20, seed)
+    filename = tmp_path / "input.txt"
+    filename.write_text(content)
+
+    module = load_day(day)
+    assert module.solve_part_a(str(filename)) == answers["a"]
+    assert module.solve_part_b(str(filename)) == answers["b"]
+
+
+def test_generate_is_deterministic():
+    assert generate(7, 50, seed=3) == generate(7, 50, seed=3)
+    assert generate(7, 50, seed=3) != generate(7, 50, seed=4)
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+from .runner import PACKAGE_DIR, discover_days, load_day
+
+# Share of the time it takes to import NumPy that a solution module may take to
+# import, measured on the same machine so that the budget holds on slow ones
+IMPORT_BUDGET = 0.5
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return the cumulative import time
+    of every module it loaded, in microseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PACKAGE_DIR.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def numpy_import_time() -> int:
+    return import_times("numpy")["numpy"]
+
+
+@pytest.mark.parametrize("module", discover_days().values())
+def test_solution_import_budget(module, numpy_import_time):
+    times = import_times(module)
+    assert "numpy" not in times
+    assert times[module] < IMPORT_BUDGET * numpy_import_time
+
+
+@pytest.mark.parametrize("day", discover_days())
+def test_solution_runs_as_script(day, tmp_path):
+    day_dir = PACKAGE_DIR / f"day{day:02d}"
+    (tmp_path / "input.txt").write_bytes((day_dir / "test_input.txt").read_bytes())
+    completed = subprocess.run(
+        [sys.executable, str(day_dir / "sol.py")],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    expected = load_day(day).solve_part_b(str(day_dir / "test_input.txt"))
+    # The answer is printed last, after any progress output.
+    assert completed.stdout.splitlines()[-1] == str(expected)
@@ -0,0 +1,73 @@
+import pytest
+
+from . import intparse
+from .intparse import parse_int_rows, parse_ints
+
+ROWS_CASES = [
+    (b"", []),
+    (b"\n", [[]]),
+    (b"3   4\n4   3\n", [[3, 4], [4, 3]]),
+    (b"1 2\n\n-30\t4\r\n5", [[1, 2], [], [-30, 4], [5]]),
+    (b"47|53\n97|13\n\n75,47,61\n", [[47, 53], [97, 13], [], [75, 47, 61]]),
+    (b"190: 10 19\n3267: 81 40 27\n", [[190, 10, 19], [3267, 81, 40, 27]]),
+]
+
+
+@pytest.mark.parametrize("data, expected", ROWS_CASES)
+def test_parse_ints(data, expected):
+    values, offsets = parse_ints(data, intparse.DEFAULT_SEPARATORS + b"|,:")
+    assert values.dtype == offsets.dtype == "int64"
+    assert values.tolist() == [value for row in expected for value in row]
+    assert offsets.tolist() == [0] + [
+        sum(len(row) for row in expected[: i + 1]) for i in range(len(expected))
+    ]
+
+
+@pytest.mark.parametrize("small_input_bytes", [2**16, -1])
+@pytest.mark.parametrize("data, expected", ROWS_CASES)
+def test_parse_int_rows(data, expected, small_input_bytes, monkeypatch):
+    monkeypatch.setattr(intparse, "SMALL_INPUT_BYTES", small_input_bytes)
+    assert parse_int_rows(data, intparse.DEFAULT_SEPARATORS + b"|,:") == expected
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"1 2\n3 x\n", r"Unexpected byte b'x' at 6"),
+        (b"1-2\n", "minus sign"),
+        (b"1 - 2\n", "minus sign"),
+        (b"12345678901234567890\n", "int64"),
+    ],
+)
+def test_parse_ints_rejects_malformed_input(data, message):
+    with pytest.raises(ValueError, match=message):
+        parse_ints(data)
+
+
+@pytest.mark.parametrize("small_input_bytes", [2**16, -1])
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"+5 1_0\n", r"Unexpected byte b'\+' at 0"),
+        (b"1_0\n", r"Unexpected byte b'_' at 1"),
+        (b"1 2\n3 x\n", r"Unexpected byte b'x' at 6"),
+        (b"1-2\n", "minus sign"),
+        (b"1 - 2\n", "minus sign"),
+        (b"--1\n", "minus sign"),
+    ],
+)
+def test_parse_int_rows_rejects_malformed_input(
+    data, message, small_input_bytes, monkeypatch
+):
+    monkeypatch.setattr(intparse, "SMALL_INPUT_BYTES", small_input_bytes)
+    with pytest.raises(ValueError, match=message):
+        parse_int_rows(data)
+
+
+def test_parse_int_rows_keeps_large_integers(monkeypatch):
+    monkeypatch.setattr(intparse, "SMALL_INPUT_BYTES", -1)
+    assert parse_int_rows(b"12345678901234567890: 1 2\n", b" :") == [
+        [12345678901234567890, 1, 2]
+    ]
+    with pytest.raises(ValueError):
+        parse_int_rows(b"1 2\n3 x\n")
@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from . import parse_cache
+from .parse_cache import evict
+from .runner import PARSER_NAMES, load_day
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+def _loader(day):
+    module = load_day(day)
+    return next(getattr(module, name) for name in PARSER_NAMES if hasattr(module, name))
+
+
+def _as_plain(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return tuple(_as_plain(item) for item in value)
+    return value
+
+
+@pytest.mark.parametrize("day", range(1, 8))
+def test_cached_loader_matches_loader(day, tmp_path, monkeypatch):
+    filename = str(TEST_DIR / f"day{day:02d}" / "test_input.txt")
+    loader = _loader(day)
+    expected = _as_plain(loader(filename))
+
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    assert _as_plain(loader(filename)) == expected
+    assert len(list(tmp_path.iterdir())) == 1
+    assert _as_plain(loader(filename)) == expected
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_cache_key_follows_content(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("AOC_CACHE_DIR", str(cache))
+    loader = _loader(2)
+    filename = tmp_path / "input.txt"
+
+    filename.write_text("1 2 3\n")
+    assert loader(str(filename)) == [[1, 2, 3]]
+    filename.write_text("4 5\n")
+    assert loader(str(filename)) == [[4, 5]]
+    assert len(list(cache.iterdir())) == 2
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    for i, mtime in enumerate((300, 100, 200)):
+        entry = tmp_path / f"entry{i}"
+        entry.mkdir()
+        (entry / "value.pickle").write_bytes(b"x" * 10)
+        os.utime(entry, (mtime, mtime))
+
+    evict(tmp_path, 20)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["entry0", "entry2"]
+
+
+def test_memory_cache_returns_copies(monkeypatch):
+    monkeypatch.setattr(parse_cache, "_memory_cache", None)
+    monkeypatch.setattr(parse_cache, "_index_cache", None)
+    parse_cache.enable_memory_cache(max_entries=1)
+    load_grid = load_day(4).load_grid
+    filename = str(TEST_DIR / "day04" / "test_input.txt")
+
+    grid = load_grid(filename)
+    grid[0][0] = "#"
+    assert load_grid(filename)[0][0] != "#"
+    assert len(parse_cache._memory_cache) == 1
+
+    load_day(6).load_input(str(TEST_DIR / "day06" / "test_input.txt"))
+    assert len(parse_cache._memory_cache) == 1
+
+
+def test_index_cache_shares_indexes(monkeypatch):
+    build_rule_matrix = load_day(5).build_rule_matrix
+    assert build_rule_matrix([(1, 2)], 3) is not build_rule_matrix([(1, 2)], 3)
+
+    monkeypatch.setattr(parse_cache, "_memory_cache", None)
+    monkeypatch.setattr(parse_cache, "_index_cache", None)
+    parse_cache.enable_memory_cache(max_entries=1)
+    rule_matrix = build_rule_matrix([(1, 2)], 3)
+    assert build_rule_matrix([(1, 2)], 3) is rule_matrix
+    assert build_rule_matrix([(2, 1)], 3) is not rule_matrix
+    assert len(parse_cache._index_cache) == 1
+    with pytest.raises(ValueError, match="read-only"):
+        rule_matrix[0, 0] = True
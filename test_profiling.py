@@ -0,0 +1,108 @@
+import cProfile
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from . import profiling
+from .profiling import labelled_report_path, profile_run, record_stages, stage
+from .runner import load_day, main, run
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+def test_stage_is_a_no_op_when_disabled():
+    with stage("parse"):
+        pass
+    assert stage("parse") is stage("search")
+    assert profiling._stage_seconds is None
+
+
+def test_record_stages():
+    with record_stages() as stage_seconds:
+        answer = load_day(5).solve_part_a_batch(
+            str(TEST_DIR / "day05" / "test_input.txt")
+        )
+    assert answer == 143
+    assert set(stage_seconds) == {"parse", "index", "search", "reduce"}
+    assert profiling._stage_seconds is None
+
+
+def test_profile_run_writes_report(tmp_path):
+    report_path = tmp_path / "report.json"
+    filename = str(TEST_DIR / "day05" / "test_input.txt")
+    answer = profile_run(load_day(5).solve_part_a_batch, filename, str(report_path))
+
+    assert answer == 143
+    report = json.loads(report_path.read_text())
+    assert set(report["stage_seconds"]) == {"parse", "index", "search", "reduce"}
+    assert report["total_seconds"] >= sum(report["stage_seconds"].values())
+    assert report["peak_traced_bytes"] > 0
+    assert report["top_allocations"]
+    assert "solve_part_a_batch" in report["cprofile"]
+    assert (tmp_path / "report.prof").exists()
+    assert profiling._stage_seconds is None
+
+
+def test_profile_run_stops_when_solve_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        profile_run(
+            load_day(5).solve_part_a, str(tmp_path / "missing.txt"), str(tmp_path)
+        )
+    assert sys.getprofile() is None
+    # Newer Pythons refuse to start a profiler while another one is enabled.
+    other = cProfile.Profile()
+    other.enable()
+    other.disable()
+    assert not tracemalloc.is_tracing()
+    assert profiling._stage_seconds is None
+
+
+def test_run_with_profile(tmp_path):
+    report_path = tmp_path / "report.json"
+    filename = str(TEST_DIR / "day04" / "test_input.txt")
+    result = run(4, "b", filename, profile=str(report_path))
+    assert result["answer"] == 9
+    assert set(json.loads(report_path.read_text())["stage_seconds"]) == {
+        "parse",
+        "search",
+    }
+
+
+def test_main_profiles_when_variable_is_set(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("AOC_PROFILE", str(tmp_path / "report.json"))
+    for day, part in ((1, "a"), (1, "b"), (2, "a")):
+        filename = str(TEST_DIR / f"day{day:02d}" / "test_input.txt")
+        main([str(day), part, filename])
+    assert capsys.readouterr().out == "11\n31\n2\n"
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == [
+        "report.day01.a.json",
+        "report.day01.b.json",
+        "report.day02.a.json",
+    ]
+
+
+def test_labelled_report_path():
+    assert labelled_report_path("out/report.json", "day05.b") == (
+        str(Path("out") / "report.day05.b.json")
+    )
+    assert labelled_report_path("report", "day05.b") == "report.day05.b.json"
+
+
+def test_profile_run_defaults_to_labelled_reports(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_PROFILE", str(tmp_path / "report.json"))
+    module = load_day(7)
+    filename = str(TEST_DIR / "day07" / "test_input.txt")
+    assert profile_run(module.solve_part_a, filename) == 3749
+    assert profile_run(module.solve_part_b, filename) == 11387
+    for function in ("solve_part_a", "solve_part_b"):
+        name = f"{module.__name__}.{function}"
+        report = json.loads((tmp_path / f"report.{name}.json").read_text())
+        assert report["function"] == name
+
+    monkeypatch.delenv("AOC_PROFILE")
+    monkeypatch.chdir(tmp_path)
+    profile_run(module.solve_part_a, filename)
+    assert (tmp_path / f"profile.{module.__name__}.solve_part_a.json").exists()
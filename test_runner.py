@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from .runner import PACKAGE_DIR, discover_days, run
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+def test_discover_days():
+    assert list(discover_days()) == [1, 2, 3, 4, 5, 6, 7]
+
+
+@pytest.mark.parametrize(
+    "day, part, function, expected_output",
+    [
+        (1, "a", None, 11),
+        (4, "b", None, 9),
+        (7, "b", None, 11387),
+        (7, "b", "solve_part_b_backward", 11387),
+    ],
+)
+def test_run(day, part, function, expected_output):
+    filename = str(TEST_DIR / f"day{day:02d}" / "test_input.txt")
+    result = run(day, part, filename, function)
+    assert result["answer"] == expected_output
+    assert result["parse_seconds"] >= 0
+    assert result["solve_seconds"] >= 0
+    assert len(result["stage_seconds"]) >= 2
+    assert result["peak_rss_bytes"] > 0
+
+
+def test_run_times_the_loader_the_solver_uses():
+    # day01 only loads small inputs with NumPy-free code, so timing its parse must
+    # not import NumPy either.
+    filename = TEST_DIR / "day01" / "test_input.txt"
+    code = (
+        f"import sys; from {PACKAGE_DIR.name}.runner import run; "
+        f"run(1, 'a', {str(filename)!r}); print('numpy' in sys.modules)"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PACKAGE_DIR.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout == "False\n"
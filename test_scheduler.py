@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+from . import scheduler
+from .scheduler import Task, all_tasks, load_history, run_all, schedule
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+def test_schedule_runs_longest_expected_first():
+    tasks = [Task(1, "a", ""), Task(6, "b", ""), Task(7, "b", ""), Task(2, "a", "")]
+    history = {
+        "day01.solve_part_a": 0.1,
+        "day02.solve_part_a": 0.2,
+        "day06.solve_part_b": 9.0,
+    }
+    assert [task.key for task in schedule(tasks, history)] == [
+        "day07.solve_part_b",
+        "day06.solve_part_b",
+        "day02.solve_part_a",
+        "day01.solve_part_a",
+    ]
+
+
+def test_all_tasks_skips_missing_inputs(monkeypatch, tmp_path):
+    monkeypatch.setattr(scheduler, "default_input", lambda day: tmp_path / f"{day}.txt")
+    (tmp_path / "3.txt").touch()
+    assert all_tasks() == [
+        Task(3, "a", str(tmp_path / "3.txt")),
+        Task(3, "b", str(tmp_path / "3.txt")),
+    ]
+
+
+def test_run_all_reports_and_records_durations(tmp_path):
+    tasks = [
+        Task(day, part, str(TEST_DIR / f"day{day:02d}" / "test_input.txt"))
+        for day in (1, 7)
+        for part in ("a", "b")
+    ]
+    tasks.append(Task(5, "a", str(tmp_path / "missing.txt")))
+    history_file = tmp_path / "history.json"
+
+    report = run_all(tasks, max_workers=2, history_file=history_file)
+
+    answers = [(r["day"], r["part"], r.get("answer")) for r in report["results"]]
+    assert answers == [
+        (1, "a", 11),
+        (1, "b", 31),
+        (5, "a", None),
+        (7, "a", 3749),
+        (7, "b", 11387),
+    ]
+    assert report["results"][2]["error"].startswith("FileNotFoundError")
+    assert report["wall_seconds"] > 0
+    history = load_history(history_file)
+    assert set(history) == {
+        "day01.solve_part_a",
+        "day01.solve_part_b",
+        "day07.solve_part_a",
+        "day07.solve_part_b",
+    }
+    for result in report["results"]:
+        if "error" not in result:
+            key = f"day{result['day']:02d}.{result['function']}"
+            assert history[key] == result["task_seconds"]
+            assert (
+                result["task_seconds"]
+                >= (result["parse_seconds"] or 0) + result["solve_seconds"]
+            )
+            assert result["peak_rss_bytes"] is None
+            assert result["worker_peak_rss_bytes"] > 0
+    json.dumps(report)
@@ -0,0 +1,107 @@
+import io
+import mmap
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from .runner import PARSER_NAMES, load_day, main
+from .sources import iter_chunks, iter_lines, read_bytes, read_text
+
+TEST_DIR = Path(__file__).resolve().parent
+
+CONTENT = b"3   4\r\n4   3\n\n2   5"
+
+
+@pytest.fixture(params=["path", "str", "bytes", "bytearray", "memoryview", "file"])
+def source(request, tmp_path):
+    filename = tmp_path / "input.txt"
+    filename.write_bytes(CONTENT)
+    if request.param == "path":
+        return filename
+    if request.param == "str":
+        return str(filename)
+    if request.param == "file":
+        file = filename.open("rb")
+        request.addfinalizer(file.close)
+        return file
+    return {"bytes": bytes, "bytearray": bytearray, "memoryview": memoryview}[
+        request.param
+    ](CONTENT)
+
+
+def test_read(source):
+    assert read_bytes(source) == CONTENT
+
+
+def test_read_text(source):
+    assert read_text(source) == "3   4\n4   3\n\n2   5"
+
+
+def test_iter_lines(source):
+    assert list(iter_lines(source)) == [b"3   4\r\n", b"4   3\n", b"\n", b"2   5"]
+
+
+def test_iter_chunks(source):
+    chunks = [bytes(chunk) for chunk in iter_chunks(source, 4)]
+    assert b"".join(chunks) == CONTENT
+    assert [len(chunk) for chunk in chunks] == [4, 4, 4, 4, 3]
+
+
+def test_mmap(tmp_path):
+    filename = tmp_path / "input.txt"
+    filename.write_bytes(CONTENT)
+    with filename.open("rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as content:
+        assert read_bytes(content) == CONTENT
+        assert list(iter_lines(content))[-1] == b"2   5"
+        chunks = list(iter_chunks(content, 8))
+        assert b"".join(chunks) == CONTENT
+        # Views must be released before the map is closed.
+        for chunk in chunks:
+            chunk.release()
+
+
+def test_stdin(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(CONTENT)))
+    assert read_bytes("-") == CONTENT
+
+
+def test_empty_input():
+    assert read_bytes(b"") == b""
+    assert list(iter_lines(b"")) == []
+    assert list(iter_chunks(b"")) == []
+
+
+def _as_plain(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return tuple(_as_plain(item) for item in value)
+    return value
+
+
+@pytest.mark.parametrize("cache", [False, True])
+@pytest.mark.parametrize("day", range(1, 8))
+def test_loaders_accept_every_source(day, cache, tmp_path, monkeypatch):
+    if cache:
+        monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    filename = TEST_DIR / f"day{day:02d}" / "test_input.txt"
+    module = load_day(day)
+    loader = next(
+        getattr(module, name) for name in PARSER_NAMES if hasattr(module, name)
+    )
+    expected = _as_plain(loader(str(filename)))
+
+    content = filename.read_bytes()
+    assert _as_plain(loader(content)) == expected
+    assert _as_plain(loader(io.BytesIO(content))) == expected
+
+
+def test_main_reads_stdin(monkeypatch, capsys):
+    content = (TEST_DIR / "day07" / "test_input.txt").read_bytes()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(content)))
+    main(["7", "b", "-", "--no-daemon"])
+    assert capsys.readouterr().out == "11387\n"